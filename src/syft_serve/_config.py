@@ -24,6 +24,9 @@ class ServerConfig:
     startup_timeout: float = 10.0  # seconds
     health_check_interval: float = 1.0  # seconds
 
+    # Environments: write pyproject.toml but skip `uv venv` / `uv sync`
+    dry_run_installs: bool = False
+
     def __post_init__(self) -> None:
         """Ensure directories exist"""
         self.log_dir.mkdir(parents=True, exist_ok=True)
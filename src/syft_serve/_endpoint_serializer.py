@@ -2,8 +2,121 @@
 Utilities for serializing endpoint functions to Python code
 """
 
+import ast
 import inspect
-from typing import Callable, Dict
+import json
+import re
+from functools import lru_cache
+from types import CodeType
+from typing import Any, Callable, Dict, List, Set, Tuple
+
+from ._exceptions import ServerStartupError
+
+_DEF_NAME_RE = re.compile(r"def\s+\w+\s*\(")
+_UNSAFE_NAME_CHARS_RE = re.compile(r"[^a-zA-Z0-9_]")
+
+
+@lru_cache(maxsize=1024)
+def _get_code_source(code: CodeType, filename: str) -> str:
+    """Source for a code object, cached since code objects are immutable
+
+    The filename is part of the key because equal code objects may come from
+    different files.
+    """
+    return inspect.getsource(code)
+
+
+def _get_source(func: Callable) -> str:
+    """Get the source code of an endpoint function"""
+    code = getattr(func, "__code__", None)
+    if isinstance(code, CodeType):
+        return _get_code_source(code, code.co_filename)
+    return inspect.getsource(func)
+
+
+_INLINE_TYPES = (str, int, float, bool, type(None))
+
+
+def _inline_constants(source: str, values: Dict[str, Any]) -> Tuple[str, Set[str]]:
+    """
+    Replace reads of immutable closure values with literal constants.
+
+    Only names that are never rebound anywhere in the function (assignment,
+    parameter, import, nested def, global/nonlocal) are folded, so the result
+    behaves exactly like the original. Returns the new source and the names
+    that were inlined.
+    """
+    # Exact types only: subclasses such as IntEnum would unparse to their repr
+    candidates = {name for name, value in values.items() if type(value) in _INLINE_TYPES}
+    if not candidates:
+        return source, set()
+
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return source, set()
+
+    bound: Set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and not isinstance(node.ctx, ast.Load):
+            bound.add(node.id)
+        elif isinstance(node, ast.arg):
+            bound.add(node.arg)
+        elif isinstance(node, (ast.Global, ast.Nonlocal)):
+            bound.update(node.names)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            bound.update((alias.asname or alias.name).split(".")[0] for alias in node.names)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            bound.add(node.name)
+        elif isinstance(node, ast.ExceptHandler) and node.name:
+            bound.add(node.name)
+
+    inlined = candidates - bound
+    if not inlined:
+        return source, set()
+
+    class _Inliner(ast.NodeTransformer):
+        def visit_Name(self, node: ast.Name) -> ast.AST:
+            if node.id in inlined and isinstance(node.ctx, ast.Load):
+                return ast.copy_location(ast.Constant(value=values[node.id]), node)
+            return node
+
+    tree = _Inliner().visit(tree)
+    try:
+        return ast.unparse(ast.fix_missing_locations(tree)), inlined
+    except ValueError:
+        # Before 3.12, unparse can't put a backslash inside an f-string
+        # expression; keep the plain assignments instead
+        return source, set()
+
+
+def _literal_to_ast(value: Any) -> ast.expr:
+    """Build an AST literal for a closure value without a repr/parse round trip"""
+    if type(value) in _INLINE_TYPES:
+        return ast.Constant(value=value)
+    if isinstance(value, list):
+        return ast.List(elts=[_literal_to_ast(v) for v in value], ctx=ast.Load())
+    if isinstance(value, tuple):
+        return ast.Tuple(elts=[_literal_to_ast(v) for v in value], ctx=ast.Load())
+    if isinstance(value, dict):
+        return ast.Dict(
+            keys=[_literal_to_ast(k) for k in value.keys()],
+            values=[_literal_to_ast(v) for v in value.values()],
+        )
+    # Anything else has to go through its repr
+    expr: ast.expr = ast.parse(repr(value), mode="eval").body
+    return expr
+
+
+def _closure_assignment(var_name: str, var_value: Any) -> str:
+    """Source line assigning a captured closure value"""
+    try:
+        value_node = _literal_to_ast(var_value)
+    except SyntaxError:
+        # Not representable as a literal; app code validation will report it
+        return f"{var_name} = {var_value!r}"
+    assign = ast.Assign(targets=[ast.Name(id=var_name, ctx=ast.Store())], value=value_node)
+    return ast.unparse(ast.fix_missing_locations(assign))
 
 
 def serialize_endpoint_function(func: Callable, func_name: str) -> str:
@@ -16,7 +129,7 @@ def serialize_endpoint_function(func: Callable, func_name: str) -> str:
     """
     try:
         # Try to get the source code
-        source = inspect.getsource(func)
+        source = _get_source(func)
 
         # Handle lambdas specially
         if "lambda" in source and source.strip().startswith("lambda"):
@@ -85,20 +198,21 @@ def serialize_endpoint_function(func: Callable, func_name: str) -> str:
             first_line = dedented_lines[0]
             if "def " in first_line:
                 # Extract everything after 'def ' and before '('
-                import re
-
-                first_line = re.sub(r"def\s+\w+\s*\(", f"def {func_name}(", first_line)
+                first_line = _DEF_NAME_RE.sub(f"def {func_name}(", first_line)
                 dedented_lines[0] = first_line
 
             # If we have closure variables, inject them at the beginning of the function
             if closure_vars:
+                # Fold immutable constants straight into their use sites
+                folded_source, inlined = _inline_constants("\n".join(dedented_lines), closure_vars)
+                dedented_lines = folded_source.split("\n")
+
                 # Add variable definitions after the function signature
                 var_lines = []
                 for var_name, var_value in closure_vars.items():
-                    if isinstance(var_value, str):
-                        var_lines.append(f"    {var_name} = {repr(var_value)}")
-                    else:
-                        var_lines.append(f"    {var_name} = {var_value}")
+                    if var_name in inlined:
+                        continue
+                    var_lines.append(f"    {_closure_assignment(var_name, var_value)}")
 
                 # Insert after the def line
                 dedented_lines = [dedented_lines[0]] + var_lines + dedented_lines[1:]
@@ -117,8 +231,6 @@ def serialize_endpoint_function(func: Callable, func_name: str) -> str:
             try:
                 result = func()
                 # If it returns a dict/list/primitive, we can generate code for it
-                import json
-
                 json_result = json.dumps(result)
                 return f"""def {func_name}():
     # Auto-generated from lambda function
@@ -143,9 +255,7 @@ def generate_app_code_from_endpoints(
     endpoint_functions = []
     for path, func in endpoints.items():
         # Create a safe function name from the path
-        import re
-
-        route_func_name = "endpoint_" + re.sub(r"[^a-zA-Z0-9_]", "_", path.strip("/"))
+        route_func_name = "endpoint_" + _UNSAFE_NAME_CHARS_RE.sub("_", path.strip("/"))
         if not route_func_name or route_func_name == "endpoint_":
             route_func_name = "endpoint_root"
 
@@ -277,12 +387,48 @@ def get_expiration_status():
 '''
 
     # Add the endpoint functions
+    parts = [app_code]
     for ep in endpoint_functions:
-        app_code += f"\n{ep['func_code']}\n"
+        parts.append(f"\n{ep['func_code']}\n")
 
-    # Add the routes
-    app_code += "\n# Register routes\n"
-    for ep in endpoint_functions:
-        app_code += f'app.add_api_route("{ep["path"]}", {ep["func_name"]}, methods=["GET"])\n'
+    # Add the routes, built as AST so paths are always quoted correctly
+    parts.append("\n# Register routes\n")
+    parts.append(_generate_route_registrations(endpoint_functions))
+    parts.append("\n")
 
+    app_code = "".join(parts)
+    try:
+        compile(app_code, "<syft-serve-app>", "exec")
+    except SyntaxError as e:
+        raise ServerStartupError(f"Generated app code for {name} is not valid Python: {e}") from e
     return app_code
+
+
+def _generate_route_registrations(endpoint_functions: List[Dict[str, str]]) -> str:
+    """Generate app.add_api_route(...) calls for the serialized endpoints"""
+    module = ast.Module(
+        body=[
+            ast.Expr(
+                value=ast.Call(
+                    func=ast.Attribute(
+                        value=ast.Name(id="app", ctx=ast.Load()),
+                        attr="add_api_route",
+                        ctx=ast.Load(),
+                    ),
+                    args=[
+                        ast.Constant(value=ep["path"]),
+                        ast.Name(id=ep["func_name"], ctx=ast.Load()),
+                    ],
+                    keywords=[
+                        ast.keyword(
+                            arg="methods",
+                            value=ast.List(elts=[ast.Constant(value="GET")], ctx=ast.Load()),
+                        )
+                    ],
+                )
+            )
+            for ep in endpoint_functions
+        ],
+        type_ignores=[],
+    )
+    return ast.unparse(ast.fix_missing_locations(module))
@@ -4,8 +4,10 @@ Simplified read-only environment access for servers
 
 import subprocess  # nosec B404
 import json
+from functools import lru_cache
+from importlib.metadata import distributions
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 
 class Environment:
@@ -39,6 +41,23 @@ class Environment:
         except (subprocess.CalledProcessError, FileNotFoundError):
             return ""
 
+    def _find_site_packages(self) -> Optional[Path]:
+        """Locate the site-packages directory of the server's virtual environment"""
+        venv_path = self.server_dir / ".venv"
+        if not venv_path.exists():
+            return None
+
+        # Windows layout
+        windows_site = venv_path / "Lib" / "site-packages"
+        if windows_site.is_dir():
+            return windows_site
+
+        # POSIX layout: .venv/lib/pythonX.Y/site-packages
+        for site in sorted((venv_path / "lib").glob("python*/site-packages")):
+            if site.is_dir():
+                return site
+        return None
+
     def _get_packages(self) -> Dict[str, str]:
         """Get installed packages as a dict"""
         # Use cache if recent (within 5 seconds)
@@ -47,6 +66,18 @@ class Environment:
         if self._cache and (time.time() - self._cache_time) < 5:
             return self._cache
 
+        # Read package metadata straight from the venv when we can find it
+        site_packages = self._find_site_packages()
+        if site_packages is not None:
+            result = {}
+            for dist in distributions(path=[str(site_packages)]):
+                name = dist.metadata["Name"]
+                if name:
+                    result[name] = dist.version
+            self._cache = result
+            self._cache_time = time.time()
+            return result
+
         # Run pip list --format=json within the environment
         output = self._run_uv_command(["pip", "list", "--format=json"])
         if not output:
@@ -68,11 +99,16 @@ class Environment:
 
     def __repr__(self) -> str:
         """Pretty tree-style representation"""
-        packages = self.list()
+        return self._render(self.server_dir.name, tuple(self.list()))
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _render(env_name: str, packages: Tuple[str, ...]) -> str:
+        """Render the package tree, cached per environment contents"""
         if not packages:
-            return f"Environment: {self.server_dir.name} (empty)"
+            return f"Environment: {env_name} (empty)"
 
-        lines = [f"Environment: {self.server_dir.name}"]
+        lines = [f"Environment: {env_name}"]
 
         # Show key packages first
         key_packages = [
@@ -3,11 +3,10 @@ Simplified ServerHandle - Individual server control and monitoring
 """
 
 import time
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 import psutil
 import requests
 
-from ._config import get_config
 from ._exceptions import ServerNotFoundError, ServerShutdownError
 
 
@@ -31,7 +30,16 @@ class ServerHandle:
         self.expiration_seconds = expiration_seconds
         self.created_at = time.time()
         self._process: Optional[psutil.Process] = None
-        self._config = get_config()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Persisted fields as a dict"""
+        return {
+            "name": self.name,
+            "port": self.port,
+            "pid": self.pid,
+            "endpoints": self.endpoints,
+            "app_module": self.app_module,
+        }
 
     @property
     def status(self) -> str:
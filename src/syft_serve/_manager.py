@@ -3,13 +3,15 @@ Simplified ServerManager - only what's needed for tutorial
 """
 
 import json
+import os
 import shutil
 import subprocess  # nosec B404
 import time
 import socket
 import re
+import threading
 from pathlib import Path
-from typing import List, Dict, Optional, Callable, Any
+from typing import List, Dict, Optional, Callable, Any, Set
 import psutil
 
 from ._handle import ServerHandle
@@ -22,13 +24,38 @@ from ._exceptions import (
 )
 from ._endpoint_serializer import generate_app_code_from_endpoints
 
+try:
+    import orjson
+
+    def _dumps(data: Any) -> bytes:
+        return orjson.dumps(data)
+
+    def _loads(raw: bytes) -> Any:
+        return orjson.loads(raw)
+
+except ImportError:
+    # Fallback to the stdlib encoder, kept compact to match orjson's output
+
+    def _dumps(data: Any) -> bytes:
+        return json.dumps(data, separators=(",", ":")).encode()
+
+    def _loads(raw: bytes) -> Any:
+        return json.loads(raw)
+
 
 class ServerManager:
     """Simple manager for FastAPI server processes"""
 
+    # Seam for port probing; tests swap in a fake instead of patching socket
+    _socket_factory = staticmethod(socket.socket)
+
     def __init__(self) -> None:
         self._config = get_config()
         self._servers: Dict[str, ServerHandle] = {}  # name -> ServerHandle
+        # Guards the registry and ports handed to servers that are still starting
+        self._lock = threading.Lock()
+        self._reserved_ports: Set[int] = set()
+        self._reserved_names: Set[str] = set()
         self._load_persistent_servers()
 
         # Create base directory for isolated server environments
@@ -40,6 +67,12 @@ class ServerManager:
         self._cleanup_dead_servers()
         return list(self._servers.values())
 
+    def servers_by_name(self) -> Dict[str, ServerHandle]:
+        """Snapshot of all managed servers keyed by name"""
+        self._cleanup_dead_servers()
+        # A copy, since other threads may register servers while the caller iterates
+        return dict(self._servers)
+
     def create_server(
         self,
         name: str,
@@ -71,41 +104,64 @@ class ServerManager:
                 "numbers, underscores, and hyphens. No spaces or special characters."
             )
 
-        # Check if name already exists
-        if name in self._servers:
-            if force:
-                # Destroy existing server
+        if force and name in self._servers:
+            # Destroy existing server outside the lock, so other creates aren't
+            # held up while it shuts down
+            try:
                 self.terminate_server(name)
-            else:
+            except ServerNotFoundError:
+                pass  # Already removed by another thread
+
+        with self._lock:
+            # A name being started by another thread is not registered yet,
+            # so it can't be replaced and counts as taken
+            if name in self._reserved_names:
+                raise ServerAlreadyExistsError(f"Server '{name}' is already being created.")
+
+            # Check if name already exists
+            if name in self._servers:
                 raise ServerAlreadyExistsError(
                     f"Server '{name}' already exists. Use force=True to replace."
                 )
 
-        # Find available port
-        port = self._find_free_port()
+            # Find available port and hold it until the server has bound it,
+            # so concurrent creates don't pick the same one
+            port = self._find_free_port()
+            self._reserved_ports.add(port)
+            self._reserved_names.add(name)
 
-        # Extract endpoint paths
-        endpoint_paths = list(endpoints.keys())
-
-        # Start the server process
-        pid = self._start_server_from_endpoints(
-            port, endpoints, name, dependencies, expiration_seconds
-        )
+        try:
+            # Extract endpoint paths
+            endpoint_paths = list(endpoints.keys())
 
-        # Create server handle
-        server = ServerHandle(
-            port=port,
-            pid=pid,
-            endpoints=endpoint_paths,
-            name=name,
-            expiration_seconds=expiration_seconds,
-        )
+            # Start the server process
+            pid = self._start_server_from_endpoints(
+                port, endpoints, name, dependencies, expiration_seconds
+            )
 
-        # Wait for server to be ready
-        self._wait_for_server_ready(server)
+            # Create server handle
+            server = ServerHandle(
+                port=port,
+                pid=pid,
+                endpoints=endpoint_paths,
+                name=name,
+                expiration_seconds=expiration_seconds,
+            )
 
-        # Register server
-        self._servers[name] = server
+            # Wait for server to be ready
+            self._wait_for_server_ready(server)
+        except BaseException:
+            with self._lock:
+                self._reserved_ports.discard(port)
+                self._reserved_names.discard(name)
+            raise
+
+        # Register server, releasing the reservations in the same step so the
+        # name is never briefly unclaimed
+        with self._lock:
+            self._reserved_ports.discard(port)
+            self._reserved_names.discard(name)
+            self._servers[name] = server
         self._save_persistent_servers()
 
         return server
@@ -142,12 +198,13 @@ class ServerManager:
                 raise
 
         # Clean up environment
-        server_dir = self._envs_dir / name
+        server_dir = self._server_env_dir(name)
         if server_dir.exists():
             shutil.rmtree(server_dir)
 
-        # Remove from registry
-        del self._servers[name]
+        # Remove from registry; dead-server cleanup may already have dropped it
+        with self._lock:
+            self._servers.pop(name, None)
         self._save_persistent_servers()
 
     def terminate_all(self, force: bool = True) -> Dict[str, Any]:
@@ -224,26 +281,34 @@ class ServerManager:
         """Find a free port within the configured range"""
         start_port, end_port = self._config.port_range
 
-        for port in range(start_port, end_port + 1):
-            if self._is_port_free(port):
+        # Probe the whole range with one socket; a failed bind leaves it
+        # unbound, so it can try the next port without a new descriptor
+        with self._socket_factory(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            if os.name != "nt":
+                # Match uvicorn, which also sets SO_REUSEADDR, so ports in
+                # TIME_WAIT count as free. On Windows it would allow binding
+                # ports that are actively in use.
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            for port in range(start_port, end_port + 1):
+                if port in self._reserved_ports:
+                    continue
+                try:
+                    sock.bind(("localhost", port))
+                except OSError:
+                    continue
                 return port
 
         raise PortInUseError(f"No free ports in range {start_port}-{end_port}")
 
-    def _is_port_free(self, port: int) -> bool:
-        """Check if port is free"""
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                sock.bind(("localhost", port))
-                return True
-        except OSError:
-            return False
+    def _server_env_dir(self, name: str) -> Path:
+        """Directory holding a server's isolated environment"""
+        return self._envs_dir / name
 
     def _create_server_environment(
         self, name: str, dependencies: Optional[List[str]] = None
     ) -> Path:
         """Create an isolated uv environment for a server"""
-        server_dir = self._envs_dir / name
+        server_dir = self._server_env_dir(name)
         server_dir.mkdir(parents=True, exist_ok=True)
 
         # Default dependencies
@@ -272,6 +337,9 @@ package = false
 """
         pyproject_path.write_text(pyproject_content)
 
+        if self._config.dry_run_installs:
+            return server_dir
+
         # Create virtual environment
         result = subprocess.run(  # nosec B603 B607
             ["uv", "venv", "--python", "3.12"], cwd=str(server_dir), capture_output=True, text=True
@@ -290,6 +358,23 @@ package = false
 
         return server_dir
 
+    def _write_app_file(self, app_file: Path, data: bytes) -> None:
+        """Write generated app code"""
+        if os.name == "nt":
+            # os.open defaults to text mode on Windows and would translate newlines
+            app_file.write_bytes(data)
+            return
+
+        # Emission fast path: one pre-encoded buffer, no buffered text wrapper
+        fd = os.open(app_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+        finally:
+            os.close(fd)
+
     def _start_server_from_endpoints(
         self,
         port: int,
@@ -315,7 +400,7 @@ package = false
 
         # Generate the app code
         app_code = generate_app_code_from_endpoints(endpoints, name, expiration_seconds)
-        app_file.write_text(app_code)
+        self._write_app_file(app_file, app_code.encode("utf-8"))
 
         # Use uv run if available for better dependency management
         if shutil.which("uv") and server_dir:
@@ -363,10 +448,10 @@ package = false
 
     def _wait_for_server_ready(self, server: ServerHandle) -> None:
         """Wait for server to be ready to accept requests"""
-        start_time = time.time()
         timeout = self._config.startup_timeout
+        deadline = time.monotonic() + timeout
 
-        while time.time() - start_time < timeout:
+        while time.monotonic() < deadline:
             if server.health_check():
                 return
             time.sleep(self._config.health_check_interval)
@@ -377,7 +462,8 @@ package = false
         """Remove dead, expired, and stopped servers from registry"""
         dead_servers = []
 
-        for name, server in self._servers.items():
+        # Iterate over a copy; other threads may register servers meanwhile
+        for name, server in list(self._servers.items()):
             status = server.status
             if status in ["stopped", "expired", "error"]:
                 dead_servers.append(name)
@@ -385,8 +471,9 @@ package = false
                 # Server expired and self-destructed
                 dead_servers.append(name)
 
-        for name in dead_servers:
-            del self._servers[name]
+        with self._lock:
+            for name in dead_servers:
+                self._servers.pop(name, None)
 
         if dead_servers:
             self._save_persistent_servers()
@@ -397,47 +484,38 @@ package = false
             return
 
         try:
-            with open(self._config.persistence_file, "r") as f:
-                data = json.load(f)
-
-            for server_data in data.get("servers", []):
-                # Verify process still exists
-                try:
-                    psutil.Process(server_data["pid"])
-                    server = ServerHandle(
-                        port=server_data["port"],
-                        pid=server_data["pid"],
-                        endpoints=server_data["endpoints"],
-                        name=server_data["name"],
-                        app_module=server_data.get("app_module"),
-                    )
-                    self._servers[server.name] = server
-                except psutil.NoSuchProcess:
-                    # Process is dead, skip
-                    pass
+            data = _loads(self._config.persistence_file.read_bytes())
+
+            # Build the registry in one pass, skipping servers whose process is gone
+            loaded = {
+                server_data["name"]: ServerHandle(
+                    port=server_data["port"],
+                    pid=server_data["pid"],
+                    endpoints=server_data["endpoints"],
+                    name=server_data["name"],
+                    app_module=server_data.get("app_module"),
+                )
+                for server_data in data.get("servers", [])
+                if psutil.pid_exists(server_data["pid"])
+            }
+            self._servers.update(loaded)
 
         except Exception as e:
             print(f"Warning: Failed to load persistent servers: {e}")
 
     def _save_persistent_servers(self) -> None:
         """Save server registry to persistence file"""
+        # Snapshot under the lock; status checks do IO and run outside it
+        with self._lock:
+            servers = list(self._servers.values())
+
         try:
             data = {
-                "servers": [
-                    {
-                        "name": server.name,
-                        "port": server.port,
-                        "pid": server.pid,
-                        "endpoints": server.endpoints,
-                        "app_module": server.app_module,
-                    }
-                    for server in self._servers.values()
-                    if server.status == "running"
-                ]
+                "servers": [server.to_dict() for server in servers if server.status == "running"]
             }
 
-            with open(self._config.persistence_file, "w") as f:
-                json.dump(data, f, indent=2)
+            # Serialize in memory and write once rather than streaming tokens
+            self._config.persistence_file.write_bytes(_dumps(data))
 
         except Exception as e:
             print(f"Warning: Failed to save persistent servers: {e}")
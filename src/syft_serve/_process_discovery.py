@@ -2,9 +2,145 @@
 Process discovery for finding all syft-serve servers
 """
 
+import os
+import re
+import select
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import psutil
 import requests
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Iterator, Optional, Tuple
+
+# One C-level scan over the joined command line instead of a per-argument loop
+_UVICORN_RE = re.compile(r"uvicorn", re.IGNORECASE)
+
+# On Linux, read /proc directly instead of building a psutil.Process per PID
+_PROC_FAST_PATH = sys.platform.startswith("linux")
+_PROC_ROOT = "/proc"
+
+# (pid, create_time) -> cmdline for server processes, None for everything else
+_classify_cache: Dict[Tuple[int, float], Optional[List[str]]] = {}
+
+
+def is_syft_serve_process(info: Dict[str, Any]) -> bool:
+    """Check whether a process_iter info dict looks like a uvicorn server"""
+    name = info.get("name")
+    if not name or "python" not in name.lower():
+        return False
+
+    cmdline = info.get("cmdline")
+    if not cmdline:
+        return False
+
+    return _UVICORN_RE.search(" ".join(cmdline)) is not None
+
+
+def _read_proc_file(path: str) -> bytes:
+    """Read a /proc file, returning b"" if the process is gone or hidden"""
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return b""
+
+
+def _iter_proc_candidates() -> Iterator[Tuple[psutil.Process, List[str]]]:
+    """Linux fast path: scan /proc/<pid>/cmdline bytes without psutil"""
+    for entry in os.listdir(_PROC_ROOT):
+        if not entry.isdigit():
+            continue
+
+        raw = _read_proc_file(f"{_PROC_ROOT}/{entry}/cmdline")
+        # Most processes are rejected here, before any decoding: bytes.lower()
+        # and a plain substring test both run in C (the latter as a memmem-style
+        # search), which beats a case-insensitive regex scan
+        if b"uvicorn" not in raw.lower():
+            continue
+
+        cmdline = [os.fsdecode(arg) for arg in raw.rstrip(b"\0").split(b"\0")]
+        info = {
+            "name": os.fsdecode(_read_proc_file(f"{_PROC_ROOT}/{entry}/comm").strip()),
+            "cmdline": cmdline,
+        }
+        if not is_syft_serve_process(info):
+            continue
+
+        try:
+            yield psutil.Process(int(entry)), cmdline
+        except psutil.NoSuchProcess:
+            continue
+
+
+def _iter_candidates() -> Iterator[Tuple[psutil.Process, List[str]]]:
+    """Yield (process, cmdline) for every process that looks like a server"""
+    if _PROC_FAST_PATH and os.path.isdir(_PROC_ROOT):
+        yield from _iter_proc_candidates()
+        return
+
+    global _classify_cache
+    seen: Dict[Tuple[int, float], Optional[List[str]]] = {}
+
+    # Only create_time is read for every process; (pid, create_time) identifies
+    # a process across calls even if its PID is later reused
+    for proc in psutil.process_iter(attrs=["create_time"], ad_value=None):
+        create_time = proc.info["create_time"]
+        key = (proc.pid, create_time)
+        if key in _classify_cache:
+            cmdline = _classify_cache[key]
+        else:
+            try:
+                with proc.oneshot():
+                    info = {"name": proc.name(), "cmdline": proc.cmdline()}
+            except psutil.NoSuchProcess:
+                continue
+            except psutil.AccessDenied:
+                info = {"name": None, "cmdline": None}
+            cmdline = info["cmdline"] if is_syft_serve_process(info) else None
+
+        if create_time is not None:
+            seen[key] = cmdline
+        if cmdline is not None:
+            yield proc, cmdline
+
+    # Keep only processes still alive, which also bounds the cache size
+    _classify_cache = seen
+
+
+def _probe_candidate(proc: psutil.Process, cmdline: List[str]) -> Optional[Dict[str, Any]]:
+    """Find a candidate's listening port and health-check it"""
+    try:
+        connections = proc.connections(kind="inet")
+    except (psutil.AccessDenied, psutil.NoSuchProcess):
+        return None
+
+    for conn in connections:
+        if conn.status == "LISTEN" and 8000 <= conn.laddr.port <= 9999:
+            # Try to verify it's a syft-serve server
+            server_info: Dict[str, Any] = {
+                "pid": proc.pid,
+                "port": conn.laddr.port,
+                "cmdline": " ".join(cmdline),
+                "process": proc,
+            }
+
+            # Try health check
+            try:
+                resp = requests.get(f"http://localhost:{conn.laddr.port}/health", timeout=0.5)
+                if resp.status_code == 200:
+                    server_info["verified"] = True
+                    server_info["health"] = "healthy"
+                else:
+                    server_info["verified"] = False
+                    server_info["health"] = "unhealthy"
+            except Exception:
+                server_info["verified"] = False
+                server_info["health"] = "unreachable"
+
+            return server_info  # Only need one port per process
+
+    return None
 
 
 def discover_syft_serve_processes() -> List[Dict[str, Any]]:
@@ -14,51 +150,70 @@ def discover_syft_serve_processes() -> List[Dict[str, Any]]:
     2. Processes listening on ports 8000-9999
     3. Processes that respond to /health endpoint
     """
-    discovered = []
-
     # Check all Python processes
-    for proc in psutil.process_iter(["pid", "name", "cmdline"]):
-        try:
-            if proc.info["name"] and "python" in proc.info["name"].lower():
-                cmdline = proc.info.get("cmdline", [])
-                if cmdline and any("uvicorn" in str(arg) for arg in cmdline):
-                    # This might be a uvicorn server
-                    # Check if it's listening on any ports
-                    try:
-                        connections = proc.connections(kind="inet")
-                        for conn in connections:
-                            if conn.status == "LISTEN" and 8000 <= conn.laddr.port <= 9999:
-                                # Try to verify it's a syft-serve server
-                                server_info = {
-                                    "pid": proc.pid,
-                                    "port": conn.laddr.port,
-                                    "cmdline": " ".join(cmdline),
-                                    "process": proc,
-                                }
-
-                                # Try health check
-                                try:
-                                    resp = requests.get(
-                                        f"http://localhost:{conn.laddr.port}/health", timeout=0.5
-                                    )
-                                    if resp.status_code == 200:
-                                        server_info["verified"] = True
-                                        server_info["health"] = "healthy"
-                                    else:
-                                        server_info["verified"] = False
-                                        server_info["health"] = "unhealthy"
-                                except Exception:
-                                    server_info["verified"] = False
-                                    server_info["health"] = "unreachable"
-
-                                discovered.append(server_info)
-                                break  # Only need one port per process
-                    except (psutil.AccessDenied, psutil.NoSuchProcess):
-                        pass
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            continue
+    candidates = list(_iter_candidates())
+
+    if len(candidates) <= 1:
+        probed = [_probe_candidate(proc, cmdline) for proc, cmdline in candidates]
+    else:
+        # Each probe waits on connection lookups and an HTTP round-trip
+        # (up to 0.5s when unreachable), so overlap them
+        with ThreadPoolExecutor(max_workers=min(32, len(candidates))) as executor:
+            probed = list(executor.map(lambda c: _probe_candidate(*c), candidates))
+
+    return [info for info in probed if info is not None]
+
 
-    return discovered
+def _psutil_wait_procs(
+    procs: List[psutil.Process], timeout: float
+) -> Tuple[List[psutil.Process], List[psutil.Process]]:
+    """Portable fallback for _wait_procs"""
+    gone, alive = psutil.wait_procs(procs, timeout=timeout)
+    return gone, alive
+
+
+def _wait_procs(
+    procs: List[psutil.Process], timeout: float
+) -> Tuple[List[psutil.Process], List[psutil.Process]]:
+    """Wait for processes to exit, returning (gone, alive)
+
+    On Linux 5.3+ this polls one pidfd per process, so exits are reported as
+    they happen; elsewhere it falls back to psutil.wait_procs.
+    """
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is None:
+        return _psutil_wait_procs(procs, timeout)
+
+    poller = select.poll()
+    fds: Dict[int, psutil.Process] = {}
+    gone: List[psutil.Process] = []
+    try:
+        for proc in procs:
+            try:
+                fd = pidfd_open(proc.pid)
+            except ProcessLookupError:
+                gone.append(proc)
+                continue
+            except OSError:
+                # Kernel without pidfd support
+                return _psutil_wait_procs(procs, timeout)
+            fds[fd] = proc
+            poller.register(fd, select.POLLIN)
+
+        deadline = time.monotonic() + timeout
+        while fds:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for fd, _ in poller.poll(remaining * 1000):
+                poller.unregister(fd)
+                gone.append(fds.pop(fd))
+                os.close(fd)
+
+        return gone, list(fds.values())
+    finally:
+        for fd in fds:
+            os.close(fd)
 
 
 def terminate_all_syft_serve_processes(force: bool = True) -> Dict[str, Any]:
@@ -70,52 +225,53 @@ def terminate_all_syft_serve_processes(force: bool = True) -> Dict[str, Any]:
     - terminated: number successfully terminated
     - failed: list of PIDs that couldn't be terminated
     """
-    import os
     import signal
-    import time
 
     processes = discover_syft_serve_processes()
     result: Dict[str, Any] = {"discovered": len(processes), "terminated": 0, "failed": []}
+    if not processes:
+        return result
 
+    def send(pid: int, sig: int, fallback: Callable[[], None]) -> None:
+        # Servers are session leaders, so one killpg reaches the whole group;
+        # otherwise signal just the process
+        if hasattr(os, "killpg"):
+            try:
+                os.killpg(pid, sig)
+                return
+            except (ProcessLookupError, PermissionError):
+                pass
+        fallback()
+
+    # Ask every process to stop first, so they all shut down concurrently
+    signalled = []
     for proc_info in processes:
         proc = proc_info["process"]
         pid = proc_info["pid"]
-
         try:
-            # Try to kill the process group first (if it's a session leader)
-            if hasattr(os, "killpg"):
-                try:
-                    os.killpg(pid, signal.SIGTERM)
-                    time.sleep(0.2)
-
-                    # Check if still alive
-                    if proc.is_running() and hasattr(signal, "SIGKILL"):
-                        os.killpg(pid, signal.SIGKILL)
-                        time.sleep(0.1)
-                except (ProcessLookupError, PermissionError):
-                    # Fall back to killing just the process
-                    proc.terminate()
-                    proc.wait(timeout=1.0)
-
-                    if proc.is_running():
-                        proc.kill()
-                        proc.wait(timeout=0.5)
-            else:
-                # Windows or systems without killpg
-                proc.terminate()
-                proc.wait(timeout=1.0)
-
-                if proc.is_running():
-                    proc.kill()
-                    proc.wait(timeout=0.5)
-
-            if not proc.is_running():
-                result["terminated"] += 1
-            else:
-                result["failed"].append(pid)
-
+            send(pid, signal.SIGTERM, proc.terminate)
+            signalled.append(proc_info)
         except Exception as e:
             print(f"Failed to terminate PID {pid}: {e}")
             result["failed"].append(pid)
 
+    # Wait for all of them at once; returns as soon as every process is gone
+    procs = [proc_info["process"] for proc_info in signalled]
+    pids = {id(proc_info["process"]): proc_info["pid"] for proc_info in signalled}
+    gone, alive = _wait_procs(procs, timeout=3.0)
+
+    for proc in alive:
+        pid = pids[id(proc)]
+        try:
+            send(pid, getattr(signal, "SIGKILL", signal.SIGTERM), proc.kill)
+        except Exception as e:
+            print(f"Failed to kill PID {pid}: {e}")
+
+    if alive:
+        killed, alive = _wait_procs(alive, timeout=1.0)
+        gone.extend(killed)
+
+    result["terminated"] += len(gone)
+    result["failed"].extend(pids[id(proc)] for proc in alive)
+
     return result
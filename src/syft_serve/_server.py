@@ -5,7 +5,7 @@ Simplified Server class - the main interface for interacting with servers
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from ._handle import ServerHandle
 from ._log_stream import LogStream
@@ -53,7 +53,22 @@ class Server:
     @property
     def uptime(self) -> str:
         """Human-readable uptime"""
-        if self.status != "running":
+        return self._uptime_for(self.status)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Status, uptime and identity read together, checking status only once"""
+        status = self.status
+        return {
+            "name": self.name,
+            "url": self.url,
+            "status": status,
+            "uptime": self._uptime_for(status),
+            "endpoints": tuple(self.endpoints),
+        }
+
+    def _uptime_for(self, status: str) -> str:
+        """Human-readable uptime given an already-fetched status"""
+        if status != "running":
             return "-"
 
         try:
@@ -2,15 +2,21 @@
 ServerCollection - simplified collection of servers with dict-like access
 """
 
-from typing import List, Optional, Iterator, Union, Any, Dict
+import operator
+from typing import List, Iterator, Optional, Union, Any, Dict, Callable, ClassVar, overload
 
 from ._server import Server
 from ._exceptions import ServerNotFoundError
 
 
+_TABLE_HEADERS = ("Name", "Port", "Status", "Endpoints", "Uptime", "PID")
+
+
 class ServerCollection:
     """Collection of servers with name and index access"""
 
+    __slots__ = ("_manager_func",)
+
     def __init__(self, manager_or_callable: Any) -> None:
         # Accept either a manager instance or a callable that returns one
         if callable(manager_or_callable):
@@ -28,48 +34,85 @@ class ServerCollection:
         handles = self._manager.list_servers()
         return [Server(handle) for handle in handles]
 
-    def __getitem__(self, key: Union[str, int]) -> Optional[Server]:
-        """Access server by name or index"""
+    def _get_handles_by_name(self) -> Dict[str, Any]:
+        """Get all server handles keyed by name, in registration order"""
+        result: Dict[str, Any] = self._manager.servers_by_name()
+        return result
+
+    def _get_by_name(self, key: str) -> Server:
+        """Access server by name, wrapping only the matching handle"""
+        handles = self._get_handles_by_name()
+        handle = handles.get(key)
+        if handle is not None:
+            return Server(handle)
+        # Helpful error message
+        names = list(handles)
+        if names:
+            raise ServerNotFoundError(
+                f"No server found with name '{key}'. " f"Available servers: {', '.join(names)}"
+            )
+        else:
+            raise ServerNotFoundError("No servers are currently running")
+
+    def _get_by_index(self, key: int) -> Server:
+        """Access server by index"""
         servers = self._get_servers()
+        try:
+            return servers[key]
+        except IndexError:
+            raise IndexError(
+                f"Server index {key} out of range. " f"Valid range: 0-{len(servers)-1}"
+            )
 
-        if isinstance(key, str):
-            # Access by name
-            for server in servers:
-                if server.name == key:
-                    return server
-            # Helpful error message
-            names = [s.name for s in servers]
-            if names:
-                raise ServerNotFoundError(
-                    f"No server found with name '{key}'. " f"Available servers: {', '.join(names)}"
-                )
+    def _get_by_slice(self, key: slice) -> List[Server]:
+        """Access a range of servers, wrapping only the selected handles"""
+        return [Server(handle) for handle in self._manager.list_servers()[key]]
+
+    # Key type -> accessor, so __getitem__ dispatches with a single lookup
+    _GETITEM: ClassVar[Dict[type, Callable[["ServerCollection", Any], Any]]] = {
+        str: _get_by_name,
+        int: _get_by_index,
+        bool: _get_by_index,
+        slice: _get_by_slice,
+    }
+
+    @overload
+    def __getitem__(self, key: Union[str, int]) -> Server: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> List[Server]: ...
+
+    def __getitem__(self, key: Union[str, int, slice]) -> Union[Server, List[Server]]:
+        """Access server by name or index, or a list of servers by slice"""
+        getter: Optional[Callable[["ServerCollection", Any], Any]] = self._GETITEM.get(type(key))
+        lookup: Any = key
+        if getter is None:
+            # Subclasses (str/int subclasses, enums) and index-like types such
+            # as numpy integers miss the exact-type table
+            if isinstance(key, str):
+                getter = ServerCollection._get_by_name
             else:
-                raise ServerNotFoundError("No servers are currently running")
-
-        elif isinstance(key, int):
-            # Access by index
-            try:
-                return servers[key]
-            except IndexError:
-                raise IndexError(
-                    f"Server index {key} out of range. " f"Valid range: 0-{len(servers)-1}"
-                )
-        else:
+                try:
+                    lookup = operator.index(lookup)
+                    getter = ServerCollection._get_by_index
+                except TypeError:
+                    pass
+        if getter is None:
             raise TypeError(
-                f"Invalid key type: {type(key).__name__}. " "Use string (name) or int (index)"
+                f"Invalid key type: {type(key).__name__}. "
+                "Use string (name), int (index) or slice"
             )
+        result: Union[Server, List[Server]] = getter(self, lookup)
+        return result
 
     def __contains__(self, name: str) -> bool:
         """Check if server name exists"""
-        try:
-            self[name]
-            return True
-        except (KeyError, ServerNotFoundError):
-            return False
+        return name in self._get_handles_by_name()
 
     def __len__(self) -> int:
         """Number of servers"""
-        return len(self._get_servers())
+        # Count handles directly; wrapping them in Server objects buys nothing here
+        return len(self._manager.list_servers())
 
     def __iter__(self) -> Iterator[Server]:
         """Iterate over servers"""
@@ -85,31 +128,34 @@ class ServerCollection:
         try:
             from tabulate import tabulate
 
-            headers = ["Name", "Port", "Status", "Endpoints", "Uptime", "PID"]
             rows = []
+            running = 0
 
             for server in servers:
-                status_icon = "✅" if server.status == "running" else "❌"
-                status = f"{status_icon} {server.status.title()}"
-                endpoints = ", ".join(server.endpoints[:2])  # Show first 2
-                if len(server.endpoints) > 2:
-                    endpoints += f" +{len(server.endpoints)-2}"
+                # Each status read is a health check, so read it once per server
+                snap = server.snapshot()
+                is_running = snap["status"] == "running"
+                running += is_running
+                status_icon = "✅" if is_running else "❌"
+                status = f"{status_icon} {snap['status'].title()}"
+                endpoints = ", ".join(snap["endpoints"][:2])  # Show first 2
+                if len(snap["endpoints"]) > 2:
+                    endpoints += f" +{len(snap['endpoints'])-2}"
 
                 rows.append(
                     [
-                        server.name,
+                        snap["name"],
                         server.port,
                         status,
                         endpoints or "-",
-                        server.uptime,
+                        snap["uptime"],
                         server.pid or "-",
                     ]
                 )
 
-            table = tabulate(rows, headers=headers, tablefmt="simple", stralign="left")
+            table = tabulate(rows, headers=_TABLE_HEADERS, tablefmt="simple", stralign="left")
 
             # Add summary
-            running = len([s for s in servers if s.status == "running"])
             stopped = len(servers) - running
             summary = f"\n{len(servers)} servers ({running} running, {stopped} stopped)"
 
@@ -2,71 +2,201 @@
 Pytest configuration and shared fixtures
 """
 
+import copy
 import pytest
 import time
 import os
-import signal
-from pathlib import Path
+from types import MappingProxyType
 
 
-@pytest.fixture(scope="session", autouse=True)
-def cleanup_session():
-    """Ensure clean state before and after test session"""
-    # Cleanup any leftover servers from previous runs
+def _terminate_all_quietly():
+    """Terminate every server, ignoring failures"""
     try:
         import syft_serve as ss
         ss.terminate_all()
     except Exception:
         pass
+
+
+def pytest_sessionstart(session):
+    """Cleanup any leftover servers from previous runs"""
+    # Only the xdist controller (or a plain run) cleans up; a worker doing so
+    # would terminate servers that other workers are still using
+    if not os.environ.get("PYTEST_XDIST_WORKER"):
+        _terminate_all_quietly()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Final cleanup once the whole session is done"""
+    if not os.environ.get("PYTEST_XDIST_WORKER"):
+        _terminate_all_quietly()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _worker_persistence_file(tmp_path_factory):
+    """Give each xdist worker its own server registry file
     
-    yield
+    Every save rewrites the whole registry, so workers sharing one file would
+    overwrite each other's entries.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if not worker:
+        yield
+        return
     
-    # Final cleanup
-    try:
-        import syft_serve as ss
-        ss.terminate_all()
-    except Exception:
-        pass
+    from syft_serve import _manager
+    
+    persistence_file = tmp_path_factory.getbasetemp() / f"servers_{worker}.json"
+    original_get_config = _manager.get_config
+    
+    def get_config():
+        config = original_get_config()
+        config.persistence_file = persistence_file
+        return config
+    
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(_manager, "get_config", get_config)
+        yield
 
 
 @pytest.fixture(autouse=True)
-def cleanup_test():
-    """Ensure clean state for each test"""
+def cleanup_test(request):
+    """Terminate servers created by tests marked with ``uses_servers``
+
+    Under pytest-xdist the per-test snapshot is skipped; the controller's
+    pytest_sessionfinish cleans up every worker's servers once all are done.
+    """
+    if (
+        request.node.get_closest_marker("uses_servers") is None
+        or os.environ.get("PYTEST_XDIST_WORKER")
+    ):
+        yield
+        return
+
     import syft_serve as ss
+    servers = ss.servers
     
-    # Record initial servers
-    initial_servers = set(ss.servers)
+    # Record initial server names
+    initial_names = {server.name for server in servers}
     
     yield
     
+    # Nothing was added, so there is nothing to diff
+    if len(servers) <= len(initial_names):
+        return
+    
     # Cleanup any servers created during test
-    current_servers = set(ss.servers)
-    new_servers = current_servers - initial_servers
+    new_names = {server.name for server in servers} - initial_names
     
-    for server_name in new_servers:
+    for server_name in new_names:
         try:
-            server = ss.servers[server_name]
-            server.terminate()
+            servers[server_name].terminate()
         except Exception:
             pass
+
+
+@pytest.fixture(scope="session")
+def ss_module():
+    """The imported syft_serve package"""
+    import syft_serve
+    return syft_serve
+
+
+@pytest.fixture(scope="session")
+def ss_public_attrs(ss_module):
+    """Declared public names of syft_serve, computed once per session"""
+    return frozenset(ss_module.__all__)
+
+
+@pytest.fixture
+def make_proc_mock():
+    """Factory for fresh psutil.Process mocks"""
+    import psutil
+    from unittest.mock import Mock
     
-    # Extra cleanup attempt
-    if len(ss.servers) > len(initial_servers):
-        try:
-            ss.terminate_all()
-        except Exception:
-            pass
+    def factory(is_running=True, status=None):
+        mock = Mock(spec=psutil.Process)
+        attrs = {"pid": 12345, "is_running.return_value": is_running}
+        if status is not None:
+            attrs["status.return_value"] = status
+        mock.configure_mock(**attrs)
+        return mock
+    return factory
+
+
+@pytest.fixture
+def mock_process(make_proc_mock):
+    """Running psutil.Process mock"""
+    return make_proc_mock()
+
+
+@pytest.fixture(scope="session")
+def http():
+    """HTTP client with a connection pool shared across the session"""
+    import httpx
+    with httpx.Client() as client:
+        yield client
+
+
+@pytest.fixture
+def app_client():
+    """Factory running a generated app in-process behind a TestClient
+
+    For tests that only need the app's HTTP behaviour, this skips spawning,
+    port probing and readiness polling of a real server process.
+    """
+    from fastapi.testclient import TestClient
+    from syft_serve._endpoint_serializer import generate_app_code_from_endpoints
+    
+    clients = []
+    
+    def make(endpoints, name="in_process"):
+        app_code = generate_app_code_from_endpoints(endpoints, name, expiration_seconds=-1)
+        namespace = {"__name__": f"{name}_app"}
+        exec(compile(app_code, f"<{name}_app>", "exec"), namespace)
+        client = TestClient(namespace["app"], raise_server_exceptions=False)
+        clients.append(client)
+        return client
+    
+    yield make
+    
+    for client in clients:
+        client.close()
 
 
 @pytest.fixture
-def temp_dir(tmp_path):
-    """Provide a temporary directory for tests"""
-    return tmp_path
+def server_handle_mock():
+    """Autospec'd ServerHandle mock, built fresh for each test"""
+    from unittest.mock import create_autospec
+    from syft_serve._handle import ServerHandle
+    handle = create_autospec(ServerHandle, instance=True)
+    handle.name = "mock_server"
+    return handle
+
+
+@pytest.fixture(scope="session")
+def _server_config_template(tmp_path_factory):
+    """ServerConfig pointing at a session temp dir, built (and mkdir'd) once"""
+    from syft_serve._config import ServerConfig
+    base = tmp_path_factory.mktemp("syft_serve")
+    return ServerConfig(
+        persistence_file=base / "servers.json",
+        log_dir=base / "logs",
+        startup_timeout=0.1,
+        health_check_interval=0.05,
+        dry_run_installs=True,
+    )
 
 
 @pytest.fixture
+def server_config(_server_config_template):
+    """Per-test shallow copy of the session ServerConfig"""
+    return copy.copy(_server_config_template)
+
+
+@pytest.fixture(scope="session")
 def simple_endpoints():
-    """Common set of simple endpoints for testing"""
+    """Common set of simple endpoints for testing (read-only, shared)"""
     def hello():
         return {"message": "Hello, World!"}
     
@@ -74,20 +204,20 @@ def simple_endpoints():
         return {"echo": data}
     
     def status():
-        return {"status": "ok", "timestamp": time.time()}
+        return {"status": "ok", "timestamp": time.monotonic_ns()}
     
     def error():
         raise ValueError("Test error")
     
-    return {
+    return MappingProxyType({
         "/": hello,
         "/echo": echo,
         "/status": status,
         "/error": error
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def slow_endpoint():
     """Endpoint that takes time to respond"""
     def slow():
@@ -97,17 +227,31 @@ def slow_endpoint():
     return slow
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cpu_intensive_endpoint():
     """Endpoint that uses CPU"""
     def compute():
-        # Simple CPU-intensive task
-        result = sum(i**2 for i in range(1000000))
-        return {"result": result}
+        # Sum of squares of 0..n-1, in closed form
+        n = 1_000_000
+        return {"result": n * (n - 1) * (2 * n - 1) // 6}
     
     return compute
 
 
+# Fixtures that boot a real server subprocess
+_REAL_SERVER_FIXTURES = frozenset({"test_server", "scratch_server"})
+
+
+def pytest_addoption(parser):
+    """Add command line options"""
+    parser.addoption(
+        "--skip-real-server",
+        action="store_true",
+        default=False,
+        help="skip tests that depend on a shared real server fixture"
+    )
+
+
 def pytest_configure(config):
     """Configure pytest with custom markers"""
     config.addinivalue_line(
@@ -118,6 +262,10 @@ def pytest_configure(config):
         "markers", 
         "slow: mark test as slow"
     )
+    config.addinivalue_line(
+        "markers",
+        "uses_servers: test spawns servers and needs per-test cleanup"
+    )
     config.addinivalue_line(
         "markers",
         "windows_only: mark test to run only on Windows"
@@ -126,11 +274,22 @@ def pytest_configure(config):
         "markers",
         "posix_only: mark test to run only on POSIX systems"
     )
+    config.addinivalue_line(
+        "markers",
+        "serial: test affects every server on the machine; skipped under xdist"
+    )
 
 
 def pytest_collection_modifyitems(config, items):
     """Modify test collection to add markers based on conditions"""
+    skip_real_server = config.getoption("--skip-real-server")
+    # Keep each test class on one xdist worker (pytest.ini sets --dist loadgroup) so
+    # module-scoped server fixtures are not booted once per worker
+    group_by_class = config.pluginmanager.hasplugin("xdist")
     for item in items:
+        if group_by_class and item.cls is not None:
+            item.add_marker(pytest.mark.xdist_group(item.cls.__name__))
+        
         # Add markers based on test names
         if "integration" in item.nodeid:
             item.add_marker(pytest.mark.integration)
@@ -144,6 +303,14 @@ def pytest_collection_modifyitems(config, items):
         
         if "posix_only" in item.keywords and os.name == 'nt':
             item.add_marker(pytest.mark.skip(reason="POSIX only test"))
+        
+        # terminate_all sweeps orphaned servers machine-wide, which would kill
+        # other workers' servers; run these in a separate, non-parallel pass
+        if "serial" in item.keywords and os.environ.get("PYTEST_XDIST_WORKER"):
+            item.add_marker(pytest.mark.skip(reason="serial test (run without -n)"))
+        
+        if skip_real_server and not _REAL_SERVER_FIXTURES.isdisjoint(item.fixturenames):
+            item.add_marker(pytest.mark.skip(reason="real server skipped (--skip-real-server)"))
 
 
 # Timeout for tests
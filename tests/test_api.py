@@ -0,0 +1,78 @@
+"""
+Tests for the high-level API functions with a mocked ServerManager
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from syft_serve import _api
+from syft_serve._server import Server
+from syft_serve._exceptions import ServerAlreadyExistsError
+
+
+@pytest.fixture
+def patched_manager(monkeypatch):
+    """Replace ServerManager in _api and reset the global manager"""
+    mock_manager = Mock()
+    manager_class = Mock(return_value=mock_manager)
+    monkeypatch.setattr(_api, "_manager", None)
+    monkeypatch.setattr(_api, "ServerManager", manager_class)
+    return manager_class, mock_manager
+
+
+class TestCreateFunction:
+    """Test create() delegates to the manager"""
+    
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            ({}, dict(dependencies=None, force=False, expiration_seconds=86400)),
+            (
+                {"dependencies": ["pandas", "numpy"]},
+                dict(dependencies=["pandas", "numpy"], force=False, expiration_seconds=86400),
+            ),
+            ({"force": True}, dict(dependencies=None, force=True, expiration_seconds=86400)),
+            ({"expiration_seconds": -1}, dict(dependencies=None, force=False, expiration_seconds=-1)),
+        ],
+    )
+    def test_create_variants(self, patched_manager, kwargs, expected):
+        """Test create() forwards its options to the manager"""
+        _, mock_manager = patched_manager
+        endpoints = {"/": lambda: {"ok": True}}
+        
+        server = _api.create(name="api_test", endpoints=endpoints, **kwargs)
+        
+        mock_manager.create_server.assert_called_once_with(
+            name="api_test", endpoints=endpoints, **expected
+        )
+        assert isinstance(server, Server)
+        assert server._handle is mock_manager.create_server.return_value
+    
+    def test_create_propagates_errors(self, patched_manager):
+        """Test manager errors reach the caller unchanged"""
+        _, mock_manager = patched_manager
+        mock_manager.create_server.side_effect = ServerAlreadyExistsError("exists")
+        
+        with pytest.raises(ServerAlreadyExistsError):
+            _api.create(name="api_test", endpoints={})
+
+
+class TestTerminateAllFunction:
+    """Test terminate_all() delegates to the manager"""
+    
+    def test_terminate_all(self, patched_manager):
+        """Test terminate_all() calls the manager once"""
+        _, mock_manager = patched_manager
+        
+        _api.terminate_all()
+        
+        mock_manager.terminate_all.assert_called_once_with()
+    
+    def test_manager_created_once(self, patched_manager):
+        """Test the global manager is created lazily and reused"""
+        manager_class, _ = patched_manager
+        
+        _api.terminate_all()
+        _api.terminate_all()
+        
+        manager_class.assert_called_once_with()
@@ -0,0 +1,151 @@
+"""
+Tests for endpoint serialization and app code generation
+"""
+
+import enum
+
+import pytest
+
+from syft_serve import _endpoint_serializer
+from syft_serve._endpoint_serializer import (
+    _get_code_source,
+    generate_app_code_from_endpoints,
+    serialize_endpoint_function,
+)
+from syft_serve._exceptions import ServerStartupError
+
+
+def hello():
+    return {"message": "Hello!"}
+
+
+def assert_all_in(text, *needles):
+    """Assert every needle occurs in text, reporting all missing ones at once"""
+    missing = [needle for needle in needles if text.find(needle) < 0]
+    assert not missing, f"missing from generated code: {missing}"
+
+
+class TestSerializeEndpointFunction:
+    """Test turning endpoint functions into source code"""
+    
+    def test_serialize_function(self):
+        """Test a module-level function is renamed and dedented"""
+        code = serialize_endpoint_function(hello, "endpoint_hello")
+        
+        assert code.startswith("def endpoint_hello():")
+        assert 'return {"message": "Hello!"}' in code
+    
+    def test_serialize_lambda(self):
+        """Test a lambda is evaluated into a constant-returning function"""
+        code = serialize_endpoint_function(lambda: {"ok": True}, "endpoint_root")
+        
+        assert code.startswith("def endpoint_root():")
+        assert 'return {"ok": true}' in code
+    
+    def test_serialize_function_with_closure(self):
+        """Test simple closure variables are injected into the body"""
+        data = {"value": 42}
+        
+        def get_data():
+            return data
+        
+        code = serialize_endpoint_function(get_data, "endpoint_data")
+        
+        assert "data = {'value': 42}" in code
+    
+    def test_closure_literals_round_trip(self):
+        """Test captured containers are emitted as equivalent literals"""
+        weights = [0.1, 0.2, float("inf")]
+        config = {"layers": (1, "relu"), "bias": None}
+        
+        def predict():
+            return {"weights": weights, "config": config}
+        
+        namespace = {}
+        exec(serialize_endpoint_function(predict, "endpoint_predict"), namespace)
+        
+        assert namespace["endpoint_predict"]() == {"weights": weights, "config": config}
+    
+    def test_constant_closure_values_are_inlined(self):
+        """Test immutable closure values are folded into their use sites"""
+        greeting = "hi"
+        
+        def greet():
+            return {"greeting": greeting}
+        
+        code = serialize_endpoint_function(greet, "endpoint_greet")
+        
+        assert "greeting = " not in code
+        assert "return {'greeting': 'hi'}" in code
+    
+    def test_enum_closure_values_are_not_inlined(self):
+        """Test int subclasses such as IntEnum are left on the assignment path"""
+        class Color(enum.IntEnum):
+            RED = 1
+        
+        color = Color.RED
+        
+        def paint():
+            return {"color": color}
+        
+        code = serialize_endpoint_function(paint, "endpoint_paint")
+        
+        assert 'return {"color": color}' in code
+        assert "    color = " in code
+    
+    def test_backslash_closure_in_fstring(self):
+        """Test a backslash string read inside an f-string still serializes"""
+        base = "C:\\data"
+        
+        def where():
+            return {"path": f"a{base}b"}
+        
+        namespace = {}
+        exec(serialize_endpoint_function(where, "endpoint_where"), namespace)
+        
+        assert namespace["endpoint_where"]() == {"path": "aC:\\datab"}
+    
+    def test_source_is_cached(self):
+        """Test repeated serialization reuses the cached source"""
+        serialize_endpoint_function(hello, "endpoint_a")
+        hits = _get_code_source.cache_info().hits
+        
+        serialize_endpoint_function(hello, "endpoint_b")
+        
+        assert _get_code_source.cache_info().hits == hits + 1
+
+
+class TestGenerateAppCode:
+    """Test generation of the complete FastAPI app"""
+    
+    def test_generated_code_is_valid_python(self):
+        """Test the generated app compiles"""
+        code = generate_app_code_from_endpoints({"/": hello, "/api/hi": hello}, "app_test")
+        
+        compile(code, "<app_test>", "exec")
+        assert_all_in(
+            code,
+            '@app.get("/health")',
+            '@app.get("/api/hash")',
+            '@app.get("/syft/info")',
+            '@app.get("/syft/expiration")',
+            "app.add_api_route('/', endpoint_root, methods=['GET'])",
+            "app.add_api_route('/api/hi', endpoint_api_hi, methods=['GET'])",
+        )
+    
+    def test_route_paths_are_escaped(self):
+        """Test paths containing quotes still produce valid code"""
+        code = generate_app_code_from_endpoints({'/say"hi': hello}, "app_test")
+        
+        compile(code, "<app_test>", "exec")
+    
+    def test_invalid_code_raises_startup_error(self, monkeypatch):
+        """Test broken generated code fails before a server is spawned"""
+        monkeypatch.setattr(
+            _endpoint_serializer,
+            "serialize_endpoint_function",
+            lambda func, func_name: f"def {func_name}(:\n    pass",
+        )
+        
+        with pytest.raises(ServerStartupError):
+            generate_app_code_from_endpoints({"/": hello}, "app_test")
@@ -0,0 +1,148 @@
+"""
+Tests for ServerHandle status and process tracking
+"""
+
+import os
+import signal
+import time
+from unittest.mock import Mock
+
+import psutil
+import pytest
+import requests
+
+from syft_serve._handle import ServerHandle
+
+
+@pytest.fixture
+def handle(mock_process, monkeypatch):
+    """ServerHandle whose process lookups return the shared mock process"""
+    monkeypatch.setattr(psutil, "Process", lambda pid: mock_process)
+    return ServerHandle(port=8123, pid=mock_process.pid, endpoints=["/"], name="test_handle")
+
+
+@pytest.fixture(scope="module")
+def canonical_handle():
+    """ServerHandle shared by tests that only read from it"""
+    return ServerHandle(port=8123, pid=12345, endpoints=["/"], name="test_handle")
+
+
+class TestServerHandle:
+    """Test ServerHandle without spawning real servers"""
+    
+    def test_initialization(self, canonical_handle):
+        """Test constructor arguments are stored"""
+        assert canonical_handle.name == "test_handle"
+        assert canonical_handle.port == 8123
+        assert canonical_handle.pid == 12345
+        assert canonical_handle.endpoints == ["/"]
+        assert canonical_handle.expiration_seconds == 86400
+    
+    def test_to_dict_returns_fresh_dict(self):
+        """Test to_dict reflects current fields and returns a new dict each call"""
+        handle = ServerHandle(port=8123, pid=12345, endpoints=["/"], name="test_handle")
+        first = handle.to_dict()
+        first["pid"] = 0
+        
+        handle.port = 8124
+        assert handle.to_dict() == {
+            "name": "test_handle",
+            "port": 8124,
+            "pid": 12345,
+            "endpoints": ["/"],
+            "app_module": None,
+        }
+    
+    def test_default_name(self):
+        """Test the name falls back to the port"""
+        assert ServerHandle(port=8123, pid=12345, endpoints=[]).name == "server_8123"
+    
+    @pytest.mark.parametrize(
+        "is_running,healthy,expected",
+        [
+            (True, True, "running"),
+            (True, False, "unhealthy"),
+            (False, True, "stopped"),
+        ],
+    )
+    def test_status(self, handle, mock_process, monkeypatch, is_running, healthy, expected):
+        """Test status reflects process liveness and health"""
+        mock_process.is_running.return_value = is_running
+        monkeypatch.setattr(handle, "health_check", lambda: healthy)
+        assert handle.status == expected
+    
+    def test_status_live_process(self, monkeypatch):
+        """Test status against the real, running test process"""
+        handle = ServerHandle(port=8123, pid=os.getpid(), endpoints=["/"], name="test_handle")
+        monkeypatch.setattr(handle, "health_check", lambda: True)
+        
+        assert handle.status == "running"
+        assert handle._get_process().pid == os.getpid()
+    
+    def test_status_expired(self, handle):
+        """Test expired status once expiration time has passed"""
+        handle.expiration_seconds = 10
+        handle.created_at = time.time() - 20
+        assert handle.status == "expired"
+    
+    def test_never_expires(self, handle):
+        """Test expiration_seconds=-1 never expires"""
+        handle.expiration_seconds = -1
+        handle.created_at = 0
+        assert not handle.is_expired()
+    
+    def test_get_process_is_cached(self, handle, mock_process, monkeypatch):
+        """Test the process object is looked up once and reused while running"""
+        process_class = Mock(return_value=mock_process)
+        monkeypatch.setattr(psutil, "Process", process_class)
+        
+        assert handle._get_process() is mock_process
+        assert handle._get_process() is mock_process
+        process_class.assert_called_once_with(12345)
+    
+    def test_health_check_unreachable(self, canonical_handle, monkeypatch):
+        """Test health check returns False when the server is unreachable"""
+        def fail(*args, **kwargs):
+            raise requests.ConnectionError()
+        
+        monkeypatch.setattr(requests, "get", fail)
+        assert canonical_handle.health_check() is False
+    
+    @pytest.mark.skipif(not hasattr(os, "killpg"), reason="POSIX only test")
+    @pytest.mark.parametrize(
+        "is_running_seq,killpg_side_effect,expected_signals,expect_tree_kill",
+        [
+            ([False, False], None, [signal.SIGTERM], False),
+            ([True, True, False, False], None, [signal.SIGTERM, signal.SIGKILL], False),
+            ([False], ProcessLookupError, [signal.SIGTERM], False),
+            ([False], PermissionError, [signal.SIGTERM], True),
+        ],
+    )
+    def test_terminate(
+        self,
+        handle,
+        mock_process,
+        monkeypatch,
+        is_running_seq,
+        killpg_side_effect,
+        expected_signals,
+        expect_tree_kill,
+    ):
+        """Test terminate escalates signals on the process group as needed"""
+        sent = []
+        tree_kills = []
+        
+        def fake_killpg(pgid, sig):
+            sent.append(sig)
+            if killpg_side_effect is not None:
+                raise killpg_side_effect()
+        
+        monkeypatch.setattr(os, "killpg", fake_killpg)
+        monkeypatch.setattr(handle, "_terminate_process_tree", tree_kills.append)
+        handle._process = mock_process
+        mock_process.is_running.side_effect = [True] + is_running_seq
+        
+        handle.terminate(timeout=0)
+        
+        assert sent == expected_signals
+        assert tree_kills == ([mock_process] if expect_tree_kill else [])
@@ -4,15 +4,39 @@ Tests for LogStream functionality
 
 import pytest
 import time
-from pathlib import Path
-import tempfile
 
 import syft_serve as ss
+from syft_serve._log_stream import LogStream
+
+pytestmark = pytest.mark.uses_servers
+
+
+def _wait_for_log(stream, needle=None, timeout=2.0, interval=0.02):
+    """Poll a LogStream until it has content (containing needle, if given)"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        data = stream.tail(200)
+        if data and (needle is None or needle in data):
+            return
+        time.sleep(interval)
+    raise TimeoutError(f"Log {stream.stream_type} did not receive {needle!r} within {timeout}s")
 
 
 @pytest.fixture
+def access_log(tmp_path):
+    """LogStream over a file pre-filled with uvicorn-style access lines"""
+    log_path = tmp_path / "test_logs_stdout.log"
+    log_path.write_text(
+        "".join(
+            f'INFO:     127.0.0.1:5000{i} - "GET /log HTTP/1.1" 200 OK\n' for i in range(5)
+        )
+    )
+    return LogStream(log_path, "stdout")
+
+
+@pytest.fixture(scope="module")
 def test_server():
-    """Create a test server that generates logs"""
+    """Create one test server that generates logs for the whole module"""
     def logging_endpoint():
         import logging
         logger = logging.getLogger("uvicorn.access")
@@ -29,27 +53,20 @@ def test_server():
 class TestLogStream:
     """Test LogStream methods"""
     
-    def test_log_tail(self, test_server):
+    def test_log_tail(self, access_log):
         """Test tail method"""
-        # Generate some log entries
-        import requests
-        for i in range(5):
-            requests.get(f"{test_server.url}/log")
-        
-        time.sleep(1)  # Wait for logs to be written
-        
-        # Test tail
-        logs = test_server.stdout.tail(10)
+        logs = access_log.tail(10)
         assert isinstance(logs, str)
-        assert len(logs) > 0
+        assert len(logs.splitlines()) == 5
+        
+        assert access_log.tail(2).splitlines() == access_log.lines()[-2:]
     
-    def test_log_head(self, test_server):
+    def test_log_head(self, test_server, http):
         """Test head method"""
         # Generate some log entries
-        import requests
-        requests.get(f"{test_server.url}/log")
+        http.get(f"{test_server.url}/log")
         
-        time.sleep(1)
+        _wait_for_log(test_server.stdout, "GET")
         
         # Test head
         logs = test_server.stdout.head(5)
@@ -57,66 +74,49 @@ class TestLogStream:
         # Should contain startup messages
         assert "Uvicorn running" in logs or "Started" in logs
     
-    def test_log_search(self, test_server):
-        """Test search method"""
-        # Generate specific log entry
-        import requests
-        requests.get(f"{test_server.url}/log")
-        
-        time.sleep(1)
-        
-        # Search for GET request
-        results = test_server.stdout.search("GET")
-        assert isinstance(results, list)
-        assert len(results) > 0
-        assert all("GET" in line for line in results)
+    def test_log_lines(self, access_log):
+        """Test lines method"""
+        lines = access_log.lines()
+        assert isinstance(lines, list)
+        assert len(lines) == 5
+        assert all("GET" in line for line in lines)
     
-    def test_log_follow(self, test_server):
-        """Test follow method (generator)"""
-        # Get follow generator
-        follower = test_server.stdout.follow()
+    def test_log_new_entries(self, test_server, http):
+        """Test new requests show up in the tail"""
+        http.get(f"{test_server.url}/log")
         
-        # Generate a log entry
-        import requests
-        requests.get(f"{test_server.url}/log")
+        # Bounded poll, so a missing entry fails fast instead of hanging
+        _wait_for_log(test_server.stdout, "GET /log")
         
-        # Read from follower (with timeout to prevent hanging)
-        lines = []
-        start_time = time.time()
-        for line in follower:
-            lines.append(line)
-            if len(lines) >= 1 or (time.time() - start_time) > 2:
-                break
-        
-        assert len(lines) >= 1
+        assert "GET /log" in test_server.stdout.tail(200)
     
-    def test_log_empty_file(self):
+    def test_log_empty_file(self, tmp_path):
         """Test handling of empty log file"""
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
-            log_path = Path(f.name)
-        
-        from syft_serve._log_stream import LogStream
+        log_path = tmp_path / "empty.log"
+        log_path.touch()
         stream = LogStream(log_path, "test")
         
         # Should handle empty file gracefully
         assert stream.tail(10) == ""
         assert stream.head(10) == ""
-        assert stream.search("test") == []
-        
-        # Cleanup
-        log_path.unlink()
+        assert stream.lines() == []
     
-    def test_log_repr(self, test_server):
+    def test_log_repr(self, tmp_path):
         """Test LogStream representation"""
-        repr_str = repr(test_server.stdout)
+        log_path = tmp_path / "s.log"
+        log_path.touch()
+        repr_str = repr(LogStream(log_path, "stdout"))
         assert "LogStream" in repr_str
         assert "stdout" in repr_str
     
-    def test_stderr_logs(self, test_server):
+    def test_stderr_logs(self, tmp_path):
         """Test stderr log stream"""
+        log_path = tmp_path / "e.log"
+        log_path.touch()
+        stderr = LogStream(log_path, "stderr")
+        
         # stderr might be empty, but methods should still work
-        stderr_tail = test_server.stderr.tail(10)
+        stderr_tail = stderr.tail(10)
         assert isinstance(stderr_tail, str)
         
-        stderr_search = test_server.stderr.search("ERROR")
-        assert isinstance(stderr_search, list)
\ No newline at end of file
+        assert stderr.lines() == []
@@ -0,0 +1,330 @@
+"""
+Tests for ServerManager internals that do not need a real server
+"""
+
+import json
+import os
+import subprocess
+import threading
+from contextlib import ExitStack
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from syft_serve._exceptions import PortInUseError, ServerAlreadyExistsError, ServerStartupError
+from syft_serve._handle import ServerHandle
+from syft_serve._manager import ServerManager
+
+
+def _bare_manager(config, servers=None):
+    """ServerManager built without __init__, so nothing is loaded from disk"""
+    manager = ServerManager.__new__(ServerManager)
+    manager._config = config
+    manager._servers = servers or {}
+    manager._lock = threading.Lock()
+    manager._reserved_ports = set()
+    manager._reserved_names = set()
+    return manager
+
+
+@pytest.fixture
+def manager(server_config):
+    """ServerManager with a temporary config and no persisted servers"""
+    return _bare_manager(server_config)
+
+
+@pytest.fixture
+def manager_ready(manager):
+    """Manager whose port, spawn, readiness and persistence steps are mocked"""
+    with ExitStack() as stack:
+        def mock(attr, **kwargs):
+            return stack.enter_context(patch.object(manager, attr, **kwargs))
+        
+        yield SimpleNamespace(
+            manager=manager,
+            port=mock("_find_free_port", return_value=8000),
+            start=mock("_start_server_from_endpoints", return_value=12345),
+            wait=mock("_wait_for_server_ready"),
+            save=mock("_save_persistent_servers"),
+        )
+
+
+@pytest.fixture
+def socket_mock(manager):
+    """Factory installing a fake socket with a given bind side effect"""
+    def make(bind=None):
+        sock = MagicMock()
+        sock.__enter__.return_value = sock
+        sock.bind.side_effect = bind
+        manager._socket_factory = MagicMock(return_value=sock)
+        return sock
+    return make
+
+
+@pytest.fixture(scope="module")
+def validating_manager(_server_config_template):
+    """Manager shared by tests that fail validation before any IO happens"""
+    return _bare_manager(_server_config_template, {"taken": SimpleNamespace(name="taken")})
+
+
+class TestWaitForServerReady:
+    """Test startup polling against a fake clock"""
+    
+    def test_ready(self, manager):
+        """Test returns as soon as the health check passes"""
+        server = SimpleNamespace(name="ready", health_check=lambda: True)
+        
+        with patch("syft_serve._manager.time.sleep") as sleep:
+            manager._wait_for_server_ready(server)
+        
+        sleep.assert_not_called()
+    
+    def test_timeout(self, manager):
+        """Test raises once the deadline passes without a healthy response"""
+        server = SimpleNamespace(name="never_ready", health_check=lambda: False)
+        
+        with patch("syft_serve._manager.time.monotonic", side_effect=[0, 0.05, 0.2]), \
+                patch("syft_serve._manager.time.sleep") as sleep:
+            with pytest.raises(ServerStartupError, match="never_ready"):
+                manager._wait_for_server_ready(server)
+        
+        sleep.assert_called_once_with(0.05)
+
+
+class TestCreateServerValidation:
+    """Test create_server rejects bad input before spawning anything"""
+    
+    @pytest.mark.parametrize(
+        "name,exc_class,match",
+        [
+            ("", ValueError, "required"),
+            (None, ValueError, "required"),
+            ("has space", ValueError, "Invalid server name"),
+            ("slash/name", ValueError, "Invalid server name"),
+            ("taken", ServerAlreadyExistsError, "already exists"),
+        ],
+    )
+    def test_invalid(self, validating_manager, name, exc_class, match):
+        """Test invalid and duplicate names raise"""
+        with pytest.raises(exc_class, match=match):
+            validating_manager.create_server(name, {"/": lambda: {}})
+
+
+class TestCreateServer:
+    """Test the create_server happy path with process startup mocked"""
+    
+    def test_create_server(self, manager_ready):
+        """Test the server is started, awaited and registered"""
+        endpoints = {"/": lambda: {}, "/hello": lambda: {}}
+        
+        server = manager_ready.manager.create_server("created", endpoints, ["numpy"])
+        
+        assert (server.name, server.port, server.pid) == ("created", 8000, 12345)
+        assert server.endpoints == ["/", "/hello"]
+        manager_ready.start.assert_called_once_with(8000, endpoints, "created", ["numpy"], 86400)
+        manager_ready.wait.assert_called_once_with(server)
+        manager_ready.save.assert_called_once_with()
+        assert manager_ready.manager._servers == {"created": server}
+        assert not manager_ready.manager._reserved_ports
+        assert not manager_ready.manager._reserved_names
+    
+    def test_create_server_startup_failure(self, manager_ready):
+        """Test a server that never becomes ready is not registered"""
+        manager_ready.wait.side_effect = ServerStartupError("not ready")
+        
+        with pytest.raises(ServerStartupError, match="not ready"):
+            manager_ready.manager.create_server("failing", {"/": lambda: {}})
+        
+        assert manager_ready.manager._servers == {}
+        assert not manager_ready.manager._reserved_ports
+        assert not manager_ready.manager._reserved_names
+    
+    def test_create_server_name_pending(self, manager_ready):
+        """Test a name still being started by another thread is taken"""
+        manager_ready.manager._reserved_names.add("pending")
+        
+        with pytest.raises(ServerAlreadyExistsError, match="already being created"):
+            manager_ready.manager.create_server("pending", {"/": lambda: {}}, force=True)
+        
+        manager_ready.start.assert_not_called()
+
+
+class TestPortManagement:
+    """Test free port discovery with a mocked socket"""
+    
+    @pytest.mark.parametrize(
+        "bind,expected",
+        [
+            (None, 8000),
+            ([OSError(), OSError(), None], 8002),
+        ],
+    )
+    def test_find_free_port(self, manager, socket_mock, bind, expected):
+        """Test the first bindable port in the range is returned"""
+        sock = socket_mock(bind)
+        assert manager._find_free_port() == expected
+        
+        # The whole scan runs on one socket
+        manager._socket_factory.assert_called_once()
+        assert sock.bind.call_count == expected - 8000 + 1
+    
+    def test_reserved_port_skipped(self, manager, socket_mock):
+        """Test ports held by servers still starting up are not handed out"""
+        manager._reserved_ports.update({8000, 8001})
+        sock = socket_mock()
+        assert manager._find_free_port() == 8002
+        sock.bind.assert_called_once_with(("localhost", 8002))
+    
+    def test_no_free_port(self, manager, socket_mock):
+        """Test raises when every port in the range is taken"""
+        sock = socket_mock(OSError())
+        with pytest.raises(PortInUseError, match="8000-8010"):
+            manager._find_free_port()
+        
+        assert sock.bind.call_count == 11
+
+
+class TestServerEnvironment:
+    """Test isolated environment setup without running uv"""
+    
+    def test_create_server_environment(self, manager, tmp_path, monkeypatch):
+        """Test pyproject is written and uv venv/sync are run in the env dir"""
+        env_dir = tmp_path / "env"
+        commands = []
+        
+        def fake_run(cmd, cwd, **kwargs):
+            commands.append((cmd, cwd))
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+        
+        monkeypatch.setattr(manager, "_server_env_dir", lambda name: env_dir)
+        monkeypatch.setattr(subprocess, "run", fake_run)
+        manager._config.dry_run_installs = False
+        
+        assert manager._create_server_environment("env_test", ["numpy"]) == env_dir
+        assert commands == [
+            (["uv", "venv", "--python", "3.12"], str(env_dir)),
+            (["uv", "sync"], str(env_dir)),
+        ]
+        assert '"numpy"' in (env_dir / "pyproject.toml").read_text()
+    
+    def test_dry_run_skips_uv(self, manager, tmp_path, monkeypatch):
+        """Test dry-run installs only write pyproject.toml"""
+        def fail(*args, **kwargs):
+            raise AssertionError("uv should not run")
+        
+        monkeypatch.setattr(manager, "_server_env_dir", lambda name: tmp_path)
+        monkeypatch.setattr(subprocess, "run", fail)
+        
+        assert manager._create_server_environment("env_test") == tmp_path
+        assert (tmp_path / "pyproject.toml").exists()
+
+
+class TestTerminateServer:
+    """Test terminate_server against an autospec'd handle"""
+    
+    @pytest.fixture
+    def registered(self, manager, server_handle_mock, tmp_path):
+        """Manager with the mock handle registered under its name"""
+        manager._envs_dir = tmp_path
+        manager._servers[server_handle_mock.name] = server_handle_mock
+        return server_handle_mock
+    
+    def test_terminate_server_by_name(self, manager, registered):
+        """Test the handle is terminated and unregistered"""
+        manager.terminate_server("mock_server")
+        
+        registered.terminate.assert_called_once_with()
+        registered.force_terminate.assert_not_called()
+        assert "mock_server" not in manager._servers
+    
+    def test_terminate_server_force_fallback(self, manager, registered):
+        """Test force_terminate is used when terminate fails and force is set"""
+        registered.terminate.side_effect = RuntimeError("stuck")
+        
+        manager.terminate_server("mock_server", force=True)
+        
+        registered.force_terminate.assert_called_once_with()
+        assert "mock_server" not in manager._servers
+    
+    def test_terminate_server_with_error(self, manager, registered):
+        """Test terminate errors propagate without force and keep the server"""
+        registered.terminate.side_effect = RuntimeError("stuck")
+        
+        with pytest.raises(RuntimeError, match="stuck"):
+            manager.terminate_server("mock_server")
+        
+        assert "mock_server" in manager._servers
+
+
+class TestRegistry:
+    """Test registry views handed out to the servers collection"""
+    
+    def test_servers_by_name_drops_dead_and_copies(self, manager):
+        """Test dead servers are cleaned up and the snapshot is detached"""
+        manager._servers = {
+            "up": SimpleNamespace(name="up", status="running"),
+            "down": SimpleNamespace(name="down", status="stopped"),
+        }
+        
+        with patch.object(manager, "_save_persistent_servers"):
+            snapshot = manager.servers_by_name()
+        
+        assert list(snapshot) == ["up"]
+        snapshot["other"] = None
+        assert list(manager._servers) == ["up"]
+
+
+class TestPersistence:
+    """Test the server registry round-trips through the persistence file"""
+    
+    def test_save_running_servers(self, manager, tmp_path, monkeypatch):
+        """Test only running servers are written, as compact JSON"""
+        manager._config.persistence_file = tmp_path / "servers.json"
+        monkeypatch.setattr(
+            ServerHandle, "status", property(lambda self: "running" if self.name == "up" else "stopped")
+        )
+        fields = {"port": 8000, "pid": 12345, "endpoints": ["/"], "app_module": None}
+        manager._servers = {
+            "up": ServerHandle(name="up", **fields),
+            "down": ServerHandle(name="down", **fields),
+        }
+        
+        manager._save_persistent_servers()
+        
+        raw = manager._config.persistence_file.read_bytes()
+        assert json.loads(raw) == {"servers": [{"name": "up", **fields}]}
+        assert b" " not in raw
+    
+    def test_save_while_registry_changes(self, manager, tmp_path, monkeypatch):
+        """Test a server removed during the status checks doesn't abort the save"""
+        manager._config.persistence_file = tmp_path / "servers.json"
+        
+        def status(self):
+            manager._servers.pop("gone", None)
+            return "running"
+        
+        monkeypatch.setattr(ServerHandle, "status", property(status))
+        fields = {"port": 8000, "pid": 12345, "endpoints": ["/"], "app_module": None}
+        manager._servers = {
+            "up": ServerHandle(name="up", **fields),
+            "gone": ServerHandle(name="gone", **fields),
+        }
+        
+        manager._save_persistent_servers()
+        
+        assert manager._config.persistence_file.exists()
+    
+    def test_load_skips_dead_processes(self, manager, tmp_path):
+        """Test servers whose process is gone are not loaded"""
+        manager._config.persistence_file = tmp_path / "servers.json"
+        entry = {"port": 8000, "endpoints": ["/"], "app_module": None}
+        manager._config.persistence_file.write_bytes(json.dumps({"servers": [
+            {"name": "alive", "pid": os.getpid(), **entry},
+            {"name": "dead", "pid": 2**22 + 1, **entry},
+        ]}).encode())
+        
+        manager._load_persistent_servers()
+        
+        assert list(manager._servers) == ["alive"]
+        assert manager._servers["alive"].pid == os.getpid()
@@ -2,67 +2,97 @@
 Performance and stress tests for syft-serve
 """
 
+import asyncio
+import os
 import pytest
 import time
 import threading
+import httpx
 import requests
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import syft_serve as ss
 
+pytestmark = pytest.mark.uses_servers
+
+# Server names are global, so suffix them per xdist worker to avoid collisions
+_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "")
+_SUFFIX = f"_{_WORKER}" if _WORKER else ""
+
+
+@pytest.fixture(scope="module")
+def perf_server():
+    """One server exposing every endpoint the performance tests need"""
+    def counter_endpoint():
+        import itertools
+        import time
+        # Endpoint source runs in the server process, so the counter lives in
+        # the app module's globals; next() on itertools.count is atomic
+        counter = globals().setdefault("_request_counter", itertools.count(1))
+        current = next(counter)
+        time.sleep(0.01)  # Simulate some work
+        return {"request_number": current}
+    
+    def large_response():
+        from fastapi import Response
+        # 1MB of raw bytes, no JSON encoding on either side
+        return Response(b"x" * (1024 * 1024), media_type="application/octet-stream")
+    
+    def memory_endpoint():
+        # Create some temporary data
+        data = list(range(10000))
+        return {"sum": sum(data)}
+    
+    endpoints = {
+        "/": lambda: {"ok": True},
+        "/count": counter_endpoint,
+        "/large": large_response,
+        "/memory": memory_endpoint,
+    }
+    # 50 extra endpoints for test_many_endpoints
+    for i in range(50):
+        endpoints[f"/endpoint_{i}"] = lambda i=i: {"endpoint": i}
+    
+    server = ss.create(name=f"perf_shared{_SUFFIX}", endpoints=endpoints)
+    yield server
+    server.terminate()
+
 
 @pytest.mark.slow
 @pytest.mark.integration
 class TestPerformance:
     """Performance and stress tests"""
     
-    def test_multiple_concurrent_requests(self):
+    def test_multiple_concurrent_requests(self, perf_server, http):
         """Test server handling multiple concurrent requests"""
-        request_count = 0
-        lock = threading.Lock()
-        
-        def counter_endpoint():
-            nonlocal request_count
-            with lock:
-                request_count += 1
-                current = request_count
-            time.sleep(0.1)  # Simulate some work
-            return {"request_number": current}
-        
-        server = ss.create(
-            name="concurrent_test",
-            endpoints={"/count": counter_endpoint}
-        )
-        
-        try:
-            # Send 20 concurrent requests
-            with ThreadPoolExecutor(max_workers=10) as executor:
-                futures = []
-                for i in range(20):
-                    future = executor.submit(
-                        requests.get, f"{server.url}/count"
-                    )
-                    futures.append(future)
-                
-                # Collect results
-                results = []
-                for future in as_completed(futures):
-                    response = future.result()
-                    assert response.status_code == 200
-                    results.append(response.json()["request_number"])
-                
-                # Verify all requests were handled
-                assert len(results) == 20
-                assert len(set(results)) == 20  # All unique numbers
-                assert max(results) == 20
-        finally:
-            server.terminate()
+        # Send 20 concurrent requests
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            futures = []
+            for i in range(20):
+                future = executor.submit(
+                    http.get, f"{perf_server.url}/count"
+                )
+                futures.append(future)
+            
+            # Collect results
+            results = []
+            for future in as_completed(futures):
+                response = future.result()
+                assert response.status_code == 200
+                results.append(response.json()["request_number"])
+            
+            # Verify all requests were handled
+            assert len(results) == 20
+            assert len(set(results)) == 20  # All unique numbers
+            # The shared server's counter persists across tests and reruns, so
+            # check for 20 consecutive numbers rather than exactly 1..20
+            assert max(results) - min(results) == 19
     
     def test_rapid_server_creation_destruction(self):
         """Test rapidly creating and destroying servers"""
-        for i in range(5):
+        def spin(i):
             server = ss.create(
-                name=f"rapid_test_{i}",
+                name=f"rapid_test_{i}{_SUFFIX}",
                 endpoints={"/": lambda i=i: {"iteration": i}}
             )
             
@@ -72,130 +102,86 @@ class TestPerformance:
             
             # Immediately terminate
             server.terminate()
-            
-            # Verify it's gone
-            assert f"rapid_test_{i}" not in ss.servers
+            return server.name
+        
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            names = list(executor.map(spin, range(5)))
+        
+        # Verify they're all gone
+        assert not any(name in ss.servers for name in names)
     
-    def test_large_response_handling(self):
+    def test_large_response_handling(self, perf_server, http):
         """Test server handling large responses"""
-        def large_response():
-            # Generate 1MB of data
-            return {
-                "data": "x" * (1024 * 1024),
-                "size": "1MB"
-            }
+        start = time.time()
+        with http.stream("GET", f"{perf_server.url}/large") as resp:
+            assert resp.status_code == 200
+            total = sum(len(chunk) for chunk in resp.iter_bytes(65536))
+        duration = time.time() - start
         
-        server = ss.create(
-            name="large_response",
-            endpoints={"/large": large_response}
-        )
+        assert total == 1024 * 1024
         
-        try:
-            start = time.time()
-            resp = requests.get(f"{server.url}/large")
-            duration = time.time() - start
-            
-            assert resp.status_code == 200
-            data = resp.json()
-            assert len(data["data"]) == 1024 * 1024
-            assert data["size"] == "1MB"
-            
-            # Should complete reasonably fast
-            assert duration < 5.0
-        finally:
-            server.terminate()
+        # Should complete reasonably fast
+        assert duration < 5.0
     
-    def test_many_endpoints(self):
+    def test_many_endpoints(self, perf_server, http):
         """Test server with many endpoints"""
-        # Create 50 endpoints
-        endpoints = {}
-        for i in range(50):
-            endpoints[f"/endpoint_{i}"] = lambda i=i: {"endpoint": i}
-        
-        server = ss.create(
-            name="many_endpoints",
-            endpoints=endpoints
-        )
+        # Probe a few endpoints concurrently
+        probes = [0, 25, 49]
+        with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+            resps = list(executor.map(
+                lambda i: http.get(f"{perf_server.url}/endpoint_{i}"), probes
+            ))
+        for i, resp in zip(probes, resps):
+            assert resp.json() == {"endpoint": i}
         
-        try:
-            # Test a few random endpoints
-            for i in [0, 25, 49]:
-                resp = requests.get(f"{server.url}/endpoint_{i}")
-                assert resp.json() == {"endpoint": i}
-            
-            # Verify all endpoints are registered
-            assert len(server.endpoints) == 50
-        finally:
-            server.terminate()
+        # Verify all endpoints are registered
+        numbered = [e for e in perf_server.endpoints if e.startswith("/endpoint_")]
+        assert len(numbered) == 50
     
-    def test_memory_leak_prevention(self):
+    def test_memory_leak_prevention(self, perf_server, http):
         """Test that servers don't leak memory over time"""
-        def memory_endpoint():
-            # Create some temporary data
-            data = list(range(10000))
-            return {"sum": sum(data)}
+        async def hammer():
+            async with httpx.AsyncClient(base_url=perf_server.url) as client:
+                return await asyncio.gather(*(client.get("/memory") for _ in range(100)))
         
-        server = ss.create(
-            name="memory_test",
-            endpoints={"/memory": memory_endpoint}
-        )
+        # Make many overlapping requests
+        for resp in asyncio.run(hammer()):
+            assert resp.json() == {"sum": 49995000}
         
-        try:
-            # Make many requests
-            for i in range(100):
-                resp = requests.get(f"{server.url}/memory")
-                assert resp.json() == {"sum": 49995000}
-            
-            # Server should still be responsive
-            final_resp = requests.get(f"{server.url}/memory")
-            assert final_resp.status_code == 200
-        finally:
-            server.terminate()
-    
+        # Server should still be responsive
+        final_resp = http.get(f"{perf_server.url}/memory")
+        assert final_resp.status_code == 200
     
-    def test_concurrent_server_access(self):
+    def test_concurrent_server_access(self, perf_server):
         """Test multiple threads accessing server collection"""
-        # Create a base server
-        server = ss.create(
-            name="concurrent_access",
-            endpoints={"/": lambda: {"ok": True}}
-        )
+        results = []
+        errors = []
         
-        try:
-            results = []
-            errors = []
-            
-            def access_servers():
-                try:
-                    # Various operations on servers collection
-                    assert "concurrent_access" in ss.servers
-                    assert len(ss.servers) >= 1
-                    
-                    s = ss.servers["concurrent_access"]
-                    assert s.name == "concurrent_access"
-                    assert s.status == "running"
-                    
-                    # Access properties
-                    _ = s.url
-                    _ = s.uptime
-                    _ = s.endpoints
-                    
-                    results.append("success")
-                except Exception as e:
-                    errors.append(str(e))
-            
-            # Run concurrent access
-            threads = []
-            for _ in range(10):
-                t = threading.Thread(target=access_servers)
-                threads.append(t)
-                t.start()
-            
-            for t in threads:
-                t.join()
-            
-            # Verify no errors
-            assert len(errors) == 0
-            assert len(results) == 10
-        finally:
-            server.terminate()
\ No newline at end of file
+        def access_servers():
+            try:
+                # Various operations on servers collection
+                assert perf_server.name in ss.servers
+                assert len(ss.servers) >= 1
+                
+                snap = ss.servers[perf_server.name].snapshot()
+                assert snap["name"] == perf_server.name
+                assert snap["status"] == "running"
+                assert snap["url"] == perf_server.url
+                
+                results.append("success")
+            except Exception as e:
+                errors.append(str(e))
+        
+        # Run concurrent access
+        threads = []
+        for _ in range(10):
+            t = threading.Thread(target=access_servers)
+            threads.append(t)
+            t.start()
+        
+        for t in threads:
+            t.join()
+        
+        # Verify no errors
+        assert len(errors) == 0
+        assert len(results) == 10
@@ -0,0 +1,302 @@
+"""
+Tests for discovering syft-serve processes from the process table
+"""
+
+import os
+import signal
+import subprocess
+import sys
+from contextlib import nullcontext
+from types import SimpleNamespace
+
+import psutil
+import pytest
+import requests
+
+from syft_serve import _process_discovery
+from syft_serve._process_discovery import (
+    discover_syft_serve_processes,
+    is_syft_serve_process,
+    terminate_all_syft_serve_processes,
+)
+
+
+def _listening(port):
+    """Connection record for a socket listening on port"""
+    return SimpleNamespace(status="LISTEN", laddr=SimpleNamespace(port=port))
+
+
+class _FakeProc:
+    """Minimal stand-in for the psutil.Process API discovery touches"""
+    
+    def __init__(self, pid, name, cmdline, connections=()):
+        self.pid = pid
+        self.info = {"create_time": 1000.0 + pid}
+        self._name = name
+        self._cmdline = cmdline
+        self._connections = connections
+        self.cmdline_calls = 0
+    
+    def oneshot(self):
+        return nullcontext()
+    
+    def name(self):
+        return self._name
+    
+    def cmdline(self):
+        self.cmdline_calls += 1
+        return self._cmdline
+    
+    def connections(self, kind):
+        if isinstance(self._connections, Exception):
+            raise self._connections
+        return list(self._connections)
+
+
+UVICORN_CMDLINE = ["python", "/venv/bin/uvicorn", "demo_app:app", "--port", "8001"]
+
+
+@pytest.fixture
+def process_table(monkeypatch):
+    """Install a fake process table and a health endpoint answering 200"""
+    def install(*procs, health_status=200):
+        monkeypatch.setattr(_process_discovery, "_PROC_FAST_PATH", False)
+        monkeypatch.setattr(_process_discovery, "_classify_cache", {})
+        monkeypatch.setattr(psutil, "process_iter", lambda *args, **kwargs: iter(procs))
+        monkeypatch.setattr(
+            requests, "get", lambda url, timeout: SimpleNamespace(status_code=health_status)
+        )
+    return install
+
+
+class TestProcessDiscovery:
+    """Test discover_syft_serve_processes against a fake process table"""
+    
+    def test_discovers_listening_uvicorn(self, process_table):
+        """Test a python uvicorn process listening in range is reported"""
+        proc = _FakeProc(101, "python3", UVICORN_CMDLINE, [_listening(8001)])
+        process_table(proc)
+        
+        (found,) = discover_syft_serve_processes()
+        
+        assert found["pid"] == 101
+        assert found["port"] == 8001
+        assert found["process"] is proc
+        assert found["cmdline"] == " ".join(UVICORN_CMDLINE)
+        assert (found["verified"], found["health"]) == (True, "healthy")
+    
+    def test_unhealthy_server(self, process_table):
+        """Test a non-200 health response is reported as unverified"""
+        process_table(
+            _FakeProc(101, "python3", UVICORN_CMDLINE, [_listening(8001)]), health_status=500
+        )
+        
+        (found,) = discover_syft_serve_processes()
+        
+        assert (found["verified"], found["health"]) == (False, "unhealthy")
+    
+    @pytest.mark.parametrize(
+        "name,cmdline,connections",
+        [
+            ("bash", UVICORN_CMDLINE, [_listening(8001)]),
+            ("python3", ["python", "script.py"], [_listening(8001)]),
+            ("python3", [], [_listening(8001)]),
+            ("python3", None, [_listening(8001)]),
+            ("python3", UVICORN_CMDLINE, [_listening(80)]),
+            ("python3", UVICORN_CMDLINE, []),
+            ("python3", UVICORN_CMDLINE, psutil.AccessDenied(101)),
+        ],
+    )
+    def test_ignored_processes(self, process_table, name, cmdline, connections):
+        """Test processes that are not syft-serve servers are skipped"""
+        process_table(_FakeProc(101, name, cmdline, connections))
+        
+        assert discover_syft_serve_processes() == []
+    
+    def test_probes_all_candidates_in_order(self, process_table):
+        """Test several candidates are all probed and keep process order"""
+        procs = [
+            _FakeProc(100 + i, "python3", UVICORN_CMDLINE, [_listening(8000 + i)])
+            for i in range(5)
+        ]
+        process_table(*procs)
+        
+        found = discover_syft_serve_processes()
+        
+        assert [info["pid"] for info in found] == [100, 101, 102, 103, 104]
+        assert [info["port"] for info in found] == [8000, 8001, 8002, 8003, 8004]
+    
+    def test_reads_only_needed_attrs(self, monkeypatch):
+        """Test process_iter is asked only for the attributes discovery uses"""
+        calls = []
+        
+        def fake_iter(*args, **kwargs):
+            calls.append((args, kwargs))
+            return iter(())
+        
+        monkeypatch.setattr(_process_discovery, "_PROC_FAST_PATH", False)
+        monkeypatch.setattr(_process_discovery, "_classify_cache", {})
+        monkeypatch.setattr(_process_discovery.psutil, "process_iter", fake_iter)
+        discover_syft_serve_processes()
+        
+        ((args, kwargs),) = calls
+        attrs = args[0] if args else kwargs["attrs"]
+        assert set(attrs) == {"create_time"}
+    
+    def test_classification_cached_across_calls(self, process_table):
+        """Test name/cmdline are read once per (pid, create_time)"""
+        server = _FakeProc(101, "python3", UVICORN_CMDLINE, [_listening(8001)])
+        other = _FakeProc(102, "bash", ["bash"])
+        process_table(server, other)
+        
+        assert len(discover_syft_serve_processes()) == 1
+        assert len(discover_syft_serve_processes()) == 1
+        
+        for proc in (server, other):
+            assert proc.cmdline_calls == 1
+        
+        # A reused PID with a new create_time is classified again
+        other.info = {"create_time": 5000.0}
+        discover_syft_serve_processes()
+        assert other.cmdline_calls == 2
+
+    
+    def test_proc_fast_path(self, tmp_path, monkeypatch):
+        """Test the Linux /proc scan finds servers without process_iter"""
+        def write_proc(pid, comm, cmdline):
+            proc_dir = tmp_path / str(pid)
+            proc_dir.mkdir()
+            (proc_dir / "comm").write_bytes(comm + b"\n")
+            (proc_dir / "cmdline").write_bytes(b"\0".join(cmdline) + b"\0")
+        
+        write_proc(101, b"python3", [arg.encode() for arg in UVICORN_CMDLINE])
+        write_proc(102, b"bash", [b"bash", b"-c", b"uvicorn"])
+        write_proc(103, b"python3", [b"python", b"script.py"])
+        (tmp_path / "self").mkdir()
+        
+        server = _FakeProc(101, "python3", UVICORN_CMDLINE, [_listening(8001)])
+        created = []
+        
+        def fake_process(pid):
+            created.append(pid)
+            return server
+        
+        def no_iter(*args, **kwargs):
+            raise AssertionError("process_iter should not be used")
+        
+        monkeypatch.setattr(_process_discovery, "_PROC_FAST_PATH", True)
+        monkeypatch.setattr(_process_discovery, "_PROC_ROOT", str(tmp_path))
+        monkeypatch.setattr(psutil, "Process", fake_process)
+        monkeypatch.setattr(psutil, "process_iter", no_iter)
+        monkeypatch.setattr(requests, "get", lambda url, timeout: SimpleNamespace(status_code=200))
+        
+        (found,) = discover_syft_serve_processes()
+        
+        assert created == [101]
+        assert found["cmdline"] == " ".join(UVICORN_CMDLINE)
+
+
+class TestIsSyftServeProcess:
+    """Test command line classification"""
+    
+    @pytest.mark.parametrize(
+        "info,expected",
+        [
+            ({"name": "python3", "cmdline": UVICORN_CMDLINE}, True),
+            ({"name": "python3.12", "cmdline": ["python", "-m", "uvicorn", "a:app"]}, True),
+            ({"name": "Python", "cmdline": ["python", "-m", "UVICORN", "a:app"]}, True),
+            ({"name": "python", "cmdline": ["uv", "run", "uvicorn", "café_app:app"]}, True),
+            ({"name": "python3", "cmdline": ["python", "script.py"]}, False),
+            ({"name": "python3", "cmdline": []}, False),
+            ({"name": "python3", "cmdline": None}, False),
+            ({"name": "node", "cmdline": ["node", "uvicorn.js"]}, False),
+            ({"name": None, "cmdline": UVICORN_CMDLINE}, False),
+        ],
+    )
+    def test_classification(self, info, expected):
+        """Test python uvicorn command lines are recognised"""
+        assert is_syft_serve_process(info) is expected
+
+
+@pytest.mark.skipif(not hasattr(os, "killpg"), reason="POSIX only test")
+class TestTerminateAllProcesses:
+    """Test orphan termination signals every process before waiting"""
+    
+    @pytest.fixture
+    def orphans(self, monkeypatch):
+        """Install discovered orphans and record signals and waits"""
+        events = []
+        
+        def install(*survives_term):
+            procs = []
+            for pid, survives in enumerate(survives_term, start=101):
+                proc = SimpleNamespace(survives=survives, terminate=None, kill=None)
+                procs.append({"pid": pid, "process": proc})
+            pid_of = {id(info["process"]): info["pid"] for info in procs}
+            
+            def fake_killpg(pid, sig):
+                events.append((pid, sig))
+                if sig == signal.SIGKILL:
+                    procs[pid - 101]["process"].survives = False
+            
+            def fake_wait_procs(procs_to_wait, timeout):
+                events.append(("wait", timeout, [pid_of[id(p)] for p in procs_to_wait]))
+                gone = [p for p in procs_to_wait if not p.survives]
+                alive = [p for p in procs_to_wait if p.survives]
+                return gone, alive
+            
+            monkeypatch.setattr(
+                _process_discovery, "discover_syft_serve_processes", lambda: procs
+            )
+            monkeypatch.setattr(os, "killpg", fake_killpg)
+            monkeypatch.setattr(_process_discovery, "_wait_procs", fake_wait_procs)
+            return procs
+        
+        install.events = events
+        return install
+    
+    def test_single_wait(self, orphans):
+        """Test all groups get SIGTERM, then one shared wait"""
+        orphans(False, False, False)
+        
+        result = terminate_all_syft_serve_processes()
+        
+        assert orphans.events == [
+            (101, signal.SIGTERM),
+            (102, signal.SIGTERM),
+            (103, signal.SIGTERM),
+            ("wait", 3.0, [101, 102, 103]),
+        ]
+        assert result == {"discovered": 3, "terminated": 3, "failed": []}
+    
+    def test_survivors_killed(self, orphans):
+        """Test only processes still running after the wait get SIGKILL"""
+        orphans(False, True)
+        
+        result = terminate_all_syft_serve_processes()
+        
+        assert orphans.events == [
+            (101, signal.SIGTERM),
+            (102, signal.SIGTERM),
+            ("wait", 3.0, [101, 102]),
+            (102, signal.SIGKILL),
+            ("wait", 1.0, [102]),
+        ]
+        assert result == {"discovered": 2, "terminated": 2, "failed": []}
+    
+    @pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="needs pidfd_open")
+    def test_wait_procs_pidfd(self):
+        """Test pidfd waiting reports exited processes and times out on the rest"""
+        quick = subprocess.Popen([sys.executable, "-c", "pass"])
+        sleeper = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        try:
+            procs = [psutil.Process(quick.pid), psutil.Process(sleeper.pid)]
+            
+            gone, alive = _process_discovery._wait_procs(procs, timeout=0.5)
+            
+            assert [p.pid for p in gone] == [quick.pid]
+            assert [p.pid for p in alive] == [sleeper.pid]
+        finally:
+            sleeper.kill()
+            sleeper.wait()
+            quick.wait()
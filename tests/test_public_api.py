@@ -2,9 +2,11 @@
 Comprehensive tests for syft-serve public API
 """
 
+import os
 import pytest
 import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict
 from pathlib import Path
 
@@ -12,6 +14,29 @@ import syft_serve as ss
 from syft_serve import ServerAlreadyExistsError, ServerNotFoundError
 
 
+_EXPECTED_PUBLIC = frozenset(
+    {"create", "servers", "terminate_all", "ServerAlreadyExistsError", "ServerNotFoundError"}
+)
+_INTERNAL_MODULES = frozenset(
+    {
+        "api",
+        "config",
+        "endpoint_serializer",
+        "environment",
+        "exceptions",
+        "handle",
+        "log_stream",
+        "manager",
+        "process_discovery",
+        "server",
+        "server_collection",
+    }
+)
+_EXPECTED_SERVERS_PUBLIC = frozenset({"terminate_all"})
+# Names that would indicate internals leaking onto the servers collection
+_SERVERS_INTERNAL = frozenset({"manager", "get_servers", "servers"})
+
+
 # Test fixtures
 @pytest.fixture
 def simple_endpoint():
@@ -40,28 +65,100 @@ def complex_endpoints():
     }
 
 
+@pytest.fixture(scope="module")
+def package_files(ss_module):
+    """File names in the syft_serve package directory, listed once"""
+    return frozenset(p.name for p in Path(ss_module.__file__).parent.iterdir())
+
+
+# Namespace server names per xdist worker so parallel workers don't collide
+_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+_PREFIX = f"{_WORKER}_"
+_SHARED_NAME = f"{_PREFIX}shared_ro"
+
+
+def _worker_servers():
+    """Names of the servers owned by this worker"""
+    return [server.name for server in ss.servers if server.name.startswith(_PREFIX)]
+
+
+@pytest.fixture(scope="class")
+def shared_readonly_server():
+    """One running server shared by the read-only TestServerObject tests"""
+    def hello():
+        return {"message": "Hello from test!"}
+    
+    server = ss.create(
+        name=_SHARED_NAME,
+        endpoints={"/": hello},
+        expiration_seconds=3600  # 1 hour
+    )
+    yield server
+    server.terminate()
+
+
 @pytest.fixture(autouse=True)
 def cleanup_servers():
     """Ensure all servers are terminated after each test"""
     yield
-    # Cleanup any servers created during tests
+    # Cleanup servers created by this worker, leaving the shared server and
+    # other workers' servers alone (terminate_all would sweep up both)
     try:
-        ss.terminate_all()
+        for name in _worker_servers():
+            if name != _SHARED_NAME:
+                ss.servers[name].terminate()
     except Exception:
         pass
 
 
+class TestAPISurface:
+    """Test what syft_serve exposes publicly"""
+    
+    def test_public_api(self, ss_module, ss_public_attrs):
+        """Test that only the documented API is public"""
+        assert ss_public_attrs == _EXPECTED_PUBLIC, (
+            f"extra={ss_public_attrs - _EXPECTED_PUBLIC} "
+            f"missing={_EXPECTED_PUBLIC - ss_public_attrs}"
+        )
+        for attr in _EXPECTED_PUBLIC:
+            assert hasattr(ss_module, attr)
+    
+    @pytest.mark.parametrize("module_name", sorted(_INTERNAL_MODULES))
+    def test_no_internal_modules_exposed(self, ss_module, module_name):
+        """Test internal modules don't leak into the public namespace"""
+        assert module_name not in vars(ss_module)
+    
+    def test_internal_modules_renamed(self, package_files):
+        """Test internal modules live in underscore-prefixed files"""
+        for module_name in _INTERNAL_MODULES:
+            assert f"_{module_name}.py" in package_files
+            assert f"{module_name}.py" not in package_files
+    
+    def test_servers_public_api(self, ss_module):
+        """Test the public methods of the servers collection"""
+        for attr in _EXPECTED_SERVERS_PUBLIC:
+            assert hasattr(ss_module.servers, attr)
+        for attr in _SERVERS_INTERNAL:
+            assert not hasattr(ss_module.servers, attr)
+    
+    def test_api_imports(self, ss_module):
+        """Test the main entry points are importable"""
+        assert hasattr(ss_module, "create")
+        assert hasattr(ss_module, "servers")
+        assert hasattr(ss_module, "terminate_all")
+
+
 class TestCreate:
     """Test the create() function"""
     
     def test_create_basic_server(self, simple_endpoint):
         """Test creating a basic server"""
         server = ss.create(
-            name="test_basic",
+            name=f"{_PREFIX}test_basic",
             endpoints={"/": simple_endpoint}
         )
         
-        assert server.name == "test_basic"
+        assert server.name == f"{_PREFIX}test_basic"
         assert server.status == "running"
         assert server.port > 0
         assert server.pid is not None
@@ -77,12 +174,12 @@ class TestCreate:
     def test_create_with_dependencies(self, simple_endpoint):
         """Test creating a server with dependencies"""
         server = ss.create(
-            name="test_deps",
+            name=f"{_PREFIX}test_deps",
             endpoints={"/": simple_endpoint},
             dependencies=["requests==2.31.0"]
         )
         
-        assert server.name == "test_deps"
+        assert server.name == f"{_PREFIX}test_deps"
         assert server.status == "running"
         
         # Check environment has the dependency
@@ -94,12 +191,12 @@ class TestCreate:
     def test_create_with_expiration(self, simple_endpoint):
         """Test creating a server with expiration"""
         server = ss.create(
-            name="test_expire",
+            name=f"{_PREFIX}test_expire",
             endpoints={"/": simple_endpoint},
             expiration_seconds=10  # 10 seconds
         )
         
-        assert server.name == "test_expire"
+        assert server.name == f"{_PREFIX}test_expire"
         assert "s" in server.expiration_info or "10s" in server.expiration_info
         
         server.terminate()
@@ -107,12 +204,12 @@ class TestCreate:
     def test_create_never_expires(self, simple_endpoint):
         """Test creating a server that never expires"""
         server = ss.create(
-            name="test_never_expire",
+            name=f"{_PREFIX}test_never_expire",
             endpoints={"/": simple_endpoint},
             expiration_seconds=-1
         )
         
-        assert server.name == "test_never_expire"
+        assert server.name == f"{_PREFIX}test_never_expire"
         assert server.expiration_info == "Never"
         
         server.terminate()
@@ -120,13 +217,13 @@ class TestCreate:
     def test_create_duplicate_error(self, simple_endpoint):
         """Test that creating duplicate server raises error"""
         server1 = ss.create(
-            name="test_duplicate",
+            name=f"{_PREFIX}test_duplicate",
             endpoints={"/": simple_endpoint}
         )
         
         with pytest.raises(ServerAlreadyExistsError):
             ss.create(
-                name="test_duplicate",
+                name=f"{_PREFIX}test_duplicate",
                 endpoints={"/": simple_endpoint}
             )
         
@@ -135,14 +232,14 @@ class TestCreate:
     def test_create_with_force(self, simple_endpoint):
         """Test force creating a server (replacing existing)"""
         server1 = ss.create(
-            name="test_force",
+            name=f"{_PREFIX}test_force",
             endpoints={"/": simple_endpoint}
         )
         old_port = server1.port
         
         # Force create with same name
         server2 = ss.create(
-            name="test_force",
+            name=f"{_PREFIX}test_force",
             endpoints={"/": lambda: {"message": "New server"}},
             force=True
         )
@@ -159,7 +256,7 @@ class TestCreate:
     def test_create_multiple_endpoints(self, complex_endpoints):
         """Test creating server with multiple endpoints"""
         server = ss.create(
-            name="test_multiple",
+            name=f"{_PREFIX}test_multiple",
             endpoints=complex_endpoints
         )
         
@@ -183,36 +280,36 @@ class TestServersCollection:
     
     def test_servers_empty(self):
         """Test servers collection when empty"""
-        assert len(ss.servers) == 0
-        assert list(ss.servers) == []
+        assert len(_worker_servers()) == 0
+        assert _worker_servers() == []
     
     def test_servers_contains(self, simple_endpoint):
         """Test checking if server exists"""
-        assert "test_server" not in ss.servers
+        assert f"{_PREFIX}test_server" not in ss.servers
         
         server = ss.create(
-            name="test_server",
+            name=f"{_PREFIX}test_server",
             endpoints={"/": simple_endpoint}
         )
         
-        assert "test_server" in ss.servers
-        assert len(ss.servers) == 1
+        assert f"{_PREFIX}test_server" in ss.servers
+        assert len(_worker_servers()) == 1
         
         server.terminate()
         
         # After termination, server should be removed
-        assert "test_server" not in ss.servers
-        assert len(ss.servers) == 0
+        assert f"{_PREFIX}test_server" not in ss.servers
+        assert len(_worker_servers()) == 0
     
     def test_servers_getitem(self, simple_endpoint):
         """Test accessing server by name"""
         server = ss.create(
-            name="test_getitem",
+            name=f"{_PREFIX}test_getitem",
             endpoints={"/": simple_endpoint}
         )
         
         # Access by name
-        retrieved = ss.servers["test_getitem"]
+        retrieved = ss.servers[f"{_PREFIX}test_getitem"]
         assert retrieved.name == server.name
         assert retrieved.port == server.port
         assert retrieved.pid == server.pid
@@ -225,23 +322,21 @@ class TestServersCollection:
     
     def test_servers_iteration(self, simple_endpoint):
         """Test iterating over servers"""
-        # Create multiple servers
-        servers = []
-        for i in range(3):
-            server = ss.create(
-                name=f"test_iter_{i}",
-                endpoints={"/": simple_endpoint}
-            )
-            servers.append(server)
+        # Create multiple servers concurrently
+        with ThreadPoolExecutor(max_workers=3) as ex:
+            servers = list(ex.map(
+                lambda i: ss.create(name=f"{_PREFIX}test_iter_{i}", endpoints={"/": simple_endpoint}),
+                range(3)
+            ))
         
         # Test iteration
-        server_names = list(ss.servers)
+        server_names = _worker_servers()
         assert len(server_names) == 3
-        assert all(name.startswith("test_iter_") for name in server_names)
+        assert all(name.startswith(f"{_PREFIX}test_iter_") for name in server_names)
         
-        # Test repr
+        # Test repr; other workers' servers may be listed too
         repr_str = repr(ss.servers)
-        assert "3 servers" in repr_str
+        assert all(name in repr_str for name in server_names)
         
         # Cleanup
         for server in servers:
@@ -249,83 +344,76 @@ class TestServersCollection:
     
     def test_servers_len(self, simple_endpoint):
         """Test length of servers collection"""
-        assert len(ss.servers) == 0
+        assert len(_worker_servers()) == 0
         
-        server1 = ss.create(name="test_len_1", endpoints={"/": simple_endpoint})
-        assert len(ss.servers) == 1
+        server1 = ss.create(name=f"{_PREFIX}test_len_1", endpoints={"/": simple_endpoint})
+        assert len(_worker_servers()) == 1
         
-        server2 = ss.create(name="test_len_2", endpoints={"/": simple_endpoint})
-        assert len(ss.servers) == 2
+        server2 = ss.create(name=f"{_PREFIX}test_len_2", endpoints={"/": simple_endpoint})
+        assert len(_worker_servers()) == 2
         
         server1.terminate()
-        assert len(ss.servers) == 1
+        assert len(_worker_servers()) == 1
         
         server2.terminate()
-        assert len(ss.servers) == 0
+        assert len(_worker_servers()) == 0
 
 
 class TestServerObject:
     """Test the Server object methods and properties"""
     
-    def test_server_properties(self, simple_endpoint):
+    def test_server_properties(self, shared_readonly_server):
         """Test basic server properties"""
-        server = ss.create(
-            name="test_props",
-            endpoints={"/": simple_endpoint}
-        )
+        server = shared_readonly_server
         
-        assert server.name == "test_props"
+        assert server.name == _SHARED_NAME
         assert server.status == "running"
         assert isinstance(server.port, int)
         assert server.port > 0
         assert server.pid is not None
         assert server.url.startswith("http://localhost:")
         assert server.uptime != "-"
-        
-        server.terminate()
     
-    def test_server_stdout_logs(self, simple_endpoint):
+    def test_server_stdout_logs(self, shared_readonly_server):
         """Test accessing stdout logs"""
-        server = ss.create(
-            name="test_stdout",
-            endpoints={"/": simple_endpoint}
-        )
-        
-        # Wait for server to start and generate some logs
-        time.sleep(2)
-        requests.get(f"{server.url}/")
+        server = shared_readonly_server
+        
+        # Poll until the server answers, then until something reaches the log
+        deadline = time.monotonic() + 2
+        while time.monotonic() < deadline:
+            try:
+                if requests.get(f"{server.url}/", timeout=0.1).ok:
+                    break
+            except requests.RequestException:
+                pass
+            time.sleep(0.02)
+        
+        deadline = time.monotonic() + 1
+        while not server.stdout.tail(1) and time.monotonic() < deadline:
+            time.sleep(0.02)
         
         # Test log methods
         assert hasattr(server.stdout, 'tail')
         assert hasattr(server.stdout, 'head')
-        assert hasattr(server.stdout, 'follow')
-        assert hasattr(server.stdout, 'search')
+        assert hasattr(server.stdout, 'lines')
         
         # Get last few lines
         logs = server.stdout.tail(10)
         assert isinstance(logs, str)
-        
-        server.terminate()
     
-    def test_server_stderr_logs(self, simple_endpoint):
+    def test_server_stderr_logs(self, shared_readonly_server):
         """Test accessing stderr logs"""
-        server = ss.create(
-            name="test_stderr",
-            endpoints={"/": simple_endpoint}
-        )
+        server = shared_readonly_server
         
         # Test log methods exist
         assert hasattr(server.stderr, 'tail')
         assert hasattr(server.stderr, 'head')
-        assert hasattr(server.stderr, 'follow')
-        assert hasattr(server.stderr, 'search')
-        
-        server.terminate()
+        assert hasattr(server.stderr, 'lines')
     
     def test_server_environment(self, simple_endpoint):
         """Test accessing server environment"""
         server = ss.create(
-            name="test_env",
+            name=f"{_PREFIX}test_env",
             endpoints={"/": simple_endpoint},
             dependencies=["tabulate>=0.9.0"]
         )
@@ -340,14 +428,14 @@ class TestServerObject:
         
         # Test repr
         env_repr = repr(env)
-        assert "test_env" in env_repr
+        assert f"{_PREFIX}test_env" in env_repr
         
         server.terminate()
     
     def test_server_terminate(self, simple_endpoint):
         """Test terminating a server"""
         server = ss.create(
-            name="test_terminate",
+            name=f"{_PREFIX}test_terminate",
             endpoints={"/": simple_endpoint}
         )
         
@@ -361,12 +449,12 @@ class TestServerObject:
         assert server.pid is None
         
         # Server should be removed from collection
-        assert "test_terminate" not in ss.servers
+        assert f"{_PREFIX}test_terminate" not in ss.servers
     
     def test_server_force_terminate(self, simple_endpoint):
         """Test force terminating a server"""
         server = ss.create(
-            name="test_force_terminate",
+            name=f"{_PREFIX}test_force_terminate",
             endpoints={"/": simple_endpoint}
         )
         
@@ -379,86 +467,46 @@ class TestServerObject:
         assert server.status == "stopped"
         assert server.pid is None
     
-    def test_server_uptime_format(self, simple_endpoint):
+    def test_server_uptime_format(self, shared_readonly_server):
         """Test uptime formatting"""
-        server = ss.create(
-            name="test_uptime",
-            endpoints={"/": simple_endpoint}
-        )
-        
-        # Just started - should be seconds
-        uptime = server.uptime
+        # Recently started - should be seconds or minutes
+        uptime = shared_readonly_server.uptime
         assert uptime.endswith("s") or "m" in uptime
-        
-        server.terminate()
     
-    def test_server_repr(self, simple_endpoint):
+    def test_server_repr(self, shared_readonly_server):
         """Test server string representation"""
-        server = ss.create(
-            name="test_repr",
-            endpoints={"/": simple_endpoint},
-            expiration_seconds=3600  # 1 hour
-        )
-        
-        repr_str = repr(server)
+        repr_str = repr(shared_readonly_server)
         
-        assert "test_repr" in repr_str
+        assert _SHARED_NAME in repr_str
         assert "✅" in repr_str  # Running status
         assert "http://localhost:" in repr_str
         assert "PID:" in repr_str
         assert "⏰" in repr_str  # Expiration emoji
-        
-        server.terminate()
 
 
+@pytest.mark.serial
 class TestTerminateAll:
-    """Test the terminate_all function"""
+    """Test the terminate_all function
+    
+    terminate_all also sweeps orphaned servers, including other xdist workers'
+    servers, so this class only runs in a non-parallel pass (pytest -m serial).
+    """
     
     def test_terminate_all_servers(self, simple_endpoint):
         """Test terminating all servers at once"""
-        # Create multiple servers
-        servers = []
-        for i in range(3):
-            server = ss.create(
-                name=f"test_terminate_all_{i}",
-                endpoints={"/": simple_endpoint}
-            )
-            servers.append(server)
+        # Create multiple servers concurrently
+        with ThreadPoolExecutor(max_workers=3) as ex:
+            servers = list(ex.map(
+                lambda i: ss.create(name=f"{_PREFIX}test_terminate_all_{i}", endpoints={"/": simple_endpoint}),
+                range(3)
+            ))
         
-        assert len(ss.servers) == 3
+        assert len(_worker_servers()) == 3
         
         # Terminate all
         ss.terminate_all()
         
         # Check all are terminated
-        assert len(ss.servers) == 0
+        assert len(_worker_servers()) == 0
         for server in servers:
             assert server.status == "stopped"
-
-
-class TestErrorHandling:
-    """Test error handling and edge cases"""
-    
-    def test_invalid_server_name(self, simple_endpoint):
-        """Test creating server with invalid name"""
-        with pytest.raises(ValueError):
-            ss.create(
-                name="",  # Empty name
-                endpoints={"/": simple_endpoint}
-            )
-    
-    def test_empty_endpoints(self):
-        """Test creating server with no endpoints"""
-        with pytest.raises(ValueError):
-            ss.create(
-                name="test_empty",
-                endpoints={}  # No endpoints
-            )
-    
-    
-    def test_server_not_found_error(self):
-        """Test accessing non-existent server"""
-        with pytest.raises(ServerNotFoundError):
-            _ = ss.servers["does_not_exist"]
-
-
@@ -0,0 +1,113 @@
+"""
+Tests for the Server wrapper using lightweight fake handles
+"""
+
+import time
+from types import MappingProxyType, SimpleNamespace
+
+import pytest
+
+from syft_serve._environment import Environment
+from syft_serve._log_stream import LogStream
+from syft_serve._server import Server
+
+
+# Shared, immutable handle attributes; each test gets its own namespace copy
+_HANDLE_FIELDS = MappingProxyType({
+    "name": "test_server",
+    "port": 8000,
+    "pid": 12345,
+    "status": "running",
+    "endpoints": ("/", "/hello"),
+    "expiration_seconds": 3600,
+})
+
+
+@pytest.fixture
+def handle():
+    """Stand-in for a ServerHandle"""
+    return SimpleNamespace(**_HANDLE_FIELDS, created_at=time.time())
+
+
+class TestServerProperties:
+    """Test Server properties delegate to the handle"""
+    
+    @pytest.mark.parametrize("attr,value", [
+        ("name", "test_name"),
+        ("port", 8080),
+        ("pid", 99999),
+        ("status", "test_status"),
+        pytest.param("endpoints", ("/a", "/b"), id="endpoints"),
+    ])
+    def test_properties_delegate_to_handle(self, handle, attr, value):
+        """Test basic properties come straight from the handle"""
+        setattr(handle, attr, value)
+        assert getattr(Server(handle), attr) == value
+    
+    @pytest.mark.parametrize("port", [1, 8000, 9000, 65535])
+    def test_url(self, handle, port):
+        """Test URL is built from the port"""
+        handle.port = port
+        assert Server(handle).url == f"http://localhost:{port}"
+    
+    def test_uptime_when_stopped(self, handle):
+        """Test uptime placeholder for stopped servers"""
+        handle.status = "stopped"
+        assert Server(handle).uptime == "-"
+    
+    def test_snapshot(self, handle):
+        """Test snapshot reads status once and reuses it for uptime"""
+        handle.status = "stopped"
+        
+        assert Server(handle).snapshot() == {
+            "name": "test_server",
+            "url": "http://localhost:8000",
+            "status": "stopped",
+            "uptime": "-",
+            "endpoints": ("/", "/hello"),
+        }
+    
+    def test_expiration_never(self, handle):
+        """Test servers with expiration_seconds=-1 never expire"""
+        handle.expiration_seconds = -1
+        assert Server(handle).expiration_info == "Never"
+    
+    def test_expiration_expired(self, handle):
+        """Test servers past their expiration report Expired"""
+        handle.created_at = time.time() - 7200
+        assert Server(handle).expiration_info == "Expired"
+    
+    def test_repr(self, handle):
+        """Test console representation"""
+        repr_str = repr(Server(handle))
+        
+        assert "Server: test_server" in repr_str
+        assert "http://localhost:8000" in repr_str
+        assert "/, /hello" in repr_str
+        assert "PID: 12345" in repr_str
+
+
+@pytest.fixture(scope="class")
+def named_server():
+    """Server shared by the accessor tests; tests must not mutate it"""
+    return Server(SimpleNamespace(**_HANDLE_FIELDS, created_at=time.time()))
+
+
+class TestServerAccessors:
+    """Test the log and environment accessors derived from the server name"""
+    
+    @pytest.mark.parametrize("stream", ["stdout", "stderr"])
+    def test_log_stream_property(self, named_server, stream):
+        """Test stdout/stderr return a LogStream for the server's log file"""
+        log = getattr(named_server, stream)
+        
+        assert isinstance(log, LogStream)
+        assert log.stream_type == stream
+        assert log.log_path.name == f"test_server_{stream}.log"
+    
+    def test_env_property(self, named_server):
+        """Test env returns an Environment for the server's directory"""
+        env = named_server.env
+        
+        assert isinstance(env, Environment)
+        assert env.server_dir.name == "test_server"
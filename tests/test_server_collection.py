@@ -0,0 +1,113 @@
+"""
+Tests for ServerCollection lookups over a fake manager
+"""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from syft_serve._exceptions import ServerNotFoundError
+from syft_serve._server_collection import ServerCollection
+
+
+def _fake_manager(handles):
+    """Manager stand-in exposing only the registry views the collection uses"""
+    return SimpleNamespace(
+        list_servers=lambda: list(handles),
+        servers_by_name=lambda: {handle.name: handle for handle in handles},
+    )
+
+
+@pytest.fixture(scope="module")
+def handles():
+    """Handles built once per module; tests must not mutate them"""
+    return tuple(
+        SimpleNamespace(
+            name=f"server{i}",
+            port=8000 + i,
+            pid=1000 + i,
+            status="running" if i < 2 else "stopped",
+            endpoints=["/"],
+            created_at=time.time(),
+            expiration_seconds=-1,
+        )
+        for i in range(3)
+    )
+
+
+@pytest.fixture
+def collection(handles):
+    """Collection over the shared handles"""
+    return ServerCollection(_fake_manager(handles))
+
+
+class TestServerCollection:
+    """Test name, index and slice access"""
+    
+    def test_getitem_by_name(self, collection):
+        """Test lookup by name returns the matching server"""
+        assert collection["server1"].port == 8001
+    
+    @pytest.mark.parametrize("index,name", [(0, "server0"), (2, "server2"), (-1, "server2")])
+    def test_getitem_by_index(self, collection, index, name):
+        """Test lookup by (negative) index follows registration order"""
+        assert collection[index].name == name
+    
+    def test_getitem_key_subclasses(self, collection):
+        """Test str/int subclasses and index-like keys fall back to isinstance"""
+        class Name(str):
+            pass
+        
+        class Index:
+            def __index__(self):
+                return 1
+        
+        assert collection[Name("server2")].name == "server2"
+        assert collection[Index()].name == "server1"
+    
+    def test_slice_access(self, collection):
+        """Test slicing returns a list of servers"""
+        assert [server.name for server in collection[0:2]] == ["server0", "server1"]
+    
+    def test_contains(self, collection):
+        """Test membership is by name"""
+        assert "server0" in collection
+        assert "missing" not in collection
+    
+    def test_len_and_iteration(self, collection):
+        """Test length and iteration order"""
+        assert len(collection) == 3
+        assert [server.name for server in collection] == ["server0", "server1", "server2"]
+    
+    def test_missing_name(self, collection):
+        """Test unknown names list the available servers"""
+        with pytest.raises(ServerNotFoundError, match="Available servers: server0, server1, server2"):
+            collection["missing"]
+    
+    def test_missing_name_when_empty(self):
+        """Test unknown names on an empty collection"""
+        with pytest.raises(ServerNotFoundError, match="No servers are currently running"):
+            ServerCollection(_fake_manager(()))["missing"]
+    
+    def test_index_out_of_range(self, collection):
+        """Test out-of-range indexes report the valid range"""
+        with pytest.raises(IndexError, match="Valid range: 0-2"):
+            collection[3]
+    
+    def test_invalid_key_type(self, collection):
+        """Test unsupported key types are rejected"""
+        with pytest.raises(TypeError, match="Invalid key type: float"):
+            collection[1.5]
+    
+    def test_repr_summary(self, collection):
+        """Test the console table ends with a status summary"""
+        assert repr(collection).endswith("3 servers (2 running, 1 stopped)")
+    
+    def test_empty_collection(self):
+        """Test length, iteration and display of an empty collection"""
+        empty = ServerCollection(_fake_manager(()))
+        
+        assert len(empty) == 0
+        assert list(empty) == []
+        assert repr(empty) == "No servers"